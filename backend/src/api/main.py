@@ -507,7 +507,7 @@ async def generate_decision_package(request: DecisionPackageRequest):
                     "recommended_action": brief.recommended_action,
                     "metrics": brief.metrics_highlighted
                 }
-                for role, brief in package.stakeholder_briefs.items()
+                for role, brief in package.briefs().items()
             },
             "robustness": {
                 "score": package.robustness.robustness_score if package.robustness else 0,
@@ -0,0 +1,28 @@
+"""
+RiskAdvisor - Optional JIT Support
+===================================
+Numba is an optional dependency. Numeric kernels are decorated with the
+`njit` exported here: with Numba installed they are compiled to native code,
+without it the decorator is a no-op and the same functions run as plain
+Python/NumPy.
+
+Author: Umang Kumar
+Date: January 2026
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
@@ -18,6 +18,8 @@ from typing import List, Dict, Optional, Tuple
 from enum import Enum
 import pulp
 from scipy import stats
+from concurrent.futures import Executor, ThreadPoolExecutor
+import os
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -36,7 +38,7 @@ class StrategyCategory(Enum):
     POLICY = "policy"
 
 
-@dataclass
+@dataclass(slots=True)
 class Strategy:
     """A mitigation strategy with costs and effectiveness."""
     id: str
@@ -88,7 +90,7 @@ class Strategy:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Constraint:
     """A constraint on the optimization."""
     name: str
@@ -140,6 +142,9 @@ class CoreOptimizer:
     - Regulatory requirements
     """
     
+    # Max concurrent CBC solves when building the Pareto frontier
+    MAX_PARALLEL_SOLVES = min(8, os.cpu_count() or 1)
+    
     def __init__(
         self,
         strategies: List[Strategy],
@@ -150,6 +155,27 @@ class CoreOptimizer:
         self.constraints = constraints
         self.risk_score = risk_score
         self.n_simulations = 1000
+        
+        # Per-strategy LP coefficients, packed by prepare() on first solve
+        self._lp_data = None
+    
+    def prepare(self) -> "CoreOptimizer":
+        """
+        Pack per-strategy LP coefficients once for reuse across solves.
+        
+        Runs lazily on the first solve; call it again after modifying
+        strategies in place. Returns self so it can be chained.
+        """
+        strategies = self.strategies
+        ids = [s.id for s in strategies]
+        self._lp_data = (
+            ids,
+            [f"x_{sid}" for sid in ids],
+            [s.risk_reduction_pct for s in strategies],
+            [s.cost_estimate for s in strategies],
+            [s.time_estimate for s in strategies]
+        )
+        return self
     
     def optimize_single_objective(
         self,
@@ -168,36 +194,40 @@ class CoreOptimizer:
         Returns:
             OptimizationResult with selected strategies
         """
+        if self._lp_data is None:
+            self.prepare()
+        ids, var_names, reductions, costs, times = self._lp_data
+        
         prob = pulp.LpProblem("SafetyStrategySelection", pulp.LpMaximize)
         
         # Decision variables (1 if selected, 0 otherwise)
-        x = {s.id: pulp.LpVariable(f"x_{s.id}", cat='Binary') 
-             for s in self.strategies}
+        x = {sid: pulp.LpVariable(name, cat='Binary') 
+             for sid, name in zip(ids, var_names)}
         
         # Objective function
         if objective == "risk_reduction":
             prob += pulp.lpSum([
-                s.risk_reduction_pct * x[s.id] 
-                for s in self.strategies
+                r * x[sid] 
+                for sid, r in zip(ids, reductions)
             ])
         elif objective == "cost":
             prob.sense = pulp.LpMinimize
             prob += pulp.lpSum([
-                s.cost_estimate * x[s.id] 
-                for s in self.strategies
+                c * x[sid] 
+                for sid, c in zip(ids, costs)
             ])
         elif objective == "timeline":
             prob.sense = pulp.LpMinimize
             prob += pulp.lpSum([
-                s.time_estimate * x[s.id] 
-                for s in self.strategies
+                t * x[sid] 
+                for sid, t in zip(ids, times)
             ])
         
         # Constraints
         # Budget constraint
         prob += pulp.lpSum([
-            s.cost_estimate * x[s.id] 
-            for s in self.strategies
+            c * x[sid] 
+            for sid, c in zip(ids, costs)
         ]) <= budget_limit
         
         # Timeline constraint (max of selected strategies if parallel)
@@ -208,7 +238,7 @@ class CoreOptimizer:
         prob.solve(pulp.PULP_CBC_CMD(msg=0))
         
         # Extract results
-        selected = [s for s in self.strategies if pulp.value(x[s.id]) == 1]
+        selected = [s for s, sid in zip(self.strategies, ids) if pulp.value(x[sid]) == 1]
         
         total_cost = sum(s.cost_estimate for s in selected)
         total_risk_reduction = sum(s.risk_reduction_pct for s in selected)
@@ -226,26 +256,39 @@ class CoreOptimizer:
         self,
         budget_limit: float,
         timeline_limit: int = 365,
-        n_solutions: int = 10
+        n_solutions: int = 10,
+        executor: Optional[Executor] = None
     ) -> List[OptimizationResult]:
         """
         Multi-objective optimization generating Pareto frontier.
         
         Returns set of non-dominated solutions trading off
         risk reduction vs cost vs timeline.
-        """
-        pareto_solutions = []
         
+        Budget steps are solved on `executor` when given (it must not be a
+        pool whose workers are blocked waiting on this call), otherwise on
+        a short-lived pool of up to MAX_PARALLEL_SOLVES threads.
+        """
         # Generate solutions by varying constraints
         budget_steps = np.linspace(budget_limit * 0.3, budget_limit, n_solutions)
         
-        for budget in budget_steps:
-            result = self.optimize_single_objective(
+        # Each budget step is an independent ILP solved in its own CBC
+        # subprocess, so the solves run concurrently (results keep step order)
+        def solve(budget: float) -> OptimizationResult:
+            return self.optimize_single_objective(
                 objective="risk_reduction",
                 budget_limit=budget,
                 timeline_limit=timeline_limit
             )
-            pareto_solutions.append(result)
+        
+        max_workers = min(len(budget_steps), self.MAX_PARALLEL_SOLVES)
+        if executor is not None:
+            pareto_solutions = list(executor.map(solve, budget_steps))
+        elif max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                pareto_solutions = list(pool.map(solve, budget_steps))
+        else:
+            pareto_solutions = [solve(budget) for budget in budget_steps]
         
         # Remove dominated solutions
         non_dominated = self._filter_dominated(pareto_solutions)
@@ -339,6 +382,7 @@ class CoreOptimizer:
             
             # Increase by 20%
             setattr(strategy, f"{parameter}_estimate", original * 1.2)
+            self.prepare()
             new_result = self.optimize_single_objective(
                 budget_limit=sum(s.cost_estimate for s in self.strategies)
             )
@@ -348,6 +392,7 @@ class CoreOptimizer:
             
             # Restore
             setattr(strategy, f"{parameter}_estimate", original)
+            self.prepare()
         
         return sensitivities
     
@@ -355,15 +400,17 @@ class CoreOptimizer:
         self,
         budget_limit: float,
         timeline_limit: int = 365,
-        risk_tolerance: str = "balanced"
+        risk_tolerance: str = "balanced",
+        executor: Optional[Executor] = None
     ) -> OptimizationResult:
         """
         Get single optimal portfolio based on risk tolerance.
         
         Args:
             risk_tolerance: 'aggressive', 'balanced', or 'conservative'
+            executor: Optional pool for the Pareto solves (see optimize_pareto)
         """
-        pareto = self.optimize_pareto(budget_limit, timeline_limit)
+        pareto = self.optimize_pareto(budget_limit, timeline_limit, executor=executor)
         
         if not pareto:
             return OptimizationResult(
@@ -5,7 +5,7 @@ Database models for strategies, constraints, recommendations, etc.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from src.db.database import Base
 
@@ -47,6 +47,11 @@ class StrategyModel(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Serves get_all(active_only=True) and get_by_category(category, active)
+        Index("ix_strategy_active_category", "is_active", "category"),
+    )
 
 
 class ConstraintModel(Base):
@@ -3,6 +3,7 @@ from src.horizons.multi_horizon import (
     MultiHorizonOptimizer,
     Horizon,
     HorizonConfig,
+    HORIZON_CONFIGS,
     HorizonPlan,
     MultiHorizonPlan
 )
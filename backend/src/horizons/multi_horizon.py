@@ -19,13 +19,16 @@ Date: January 2026
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Mapping, Optional, Set, Tuple
+from types import MappingProxyType
 from enum import Enum
 import numpy as np
 import logging
+import threading
 from copy import deepcopy
 
 from src.core.optimizer import Strategy, OptimizationResult, CoreOptimizer, StrategyCategory
+from src.core.jit import njit
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,9 +44,9 @@ class Horizon(Enum):
     STRATEGIC = "strategic"    # 180+ days
 
 
-@dataclass
+@dataclass(frozen=True)
 class HorizonConfig:
-    """Configuration for a time horizon."""
+    """Configuration for a time horizon (immutable; shared by all optimizers)."""
     horizon: Horizon
     label: str
     min_days: int
@@ -55,7 +58,7 @@ class HorizonConfig:
     budget_fraction_recommended: float = 0.33
     
     # Strategy preferences
-    preferred_categories: List[StrategyCategory] = field(default_factory=list)
+    preferred_categories: Tuple[StrategyCategory, ...] = ()
     max_complexity: str = "high"  # low, medium, high
     
     # Objectives
@@ -101,6 +104,74 @@ class MultiHorizonPlan:
     cross_horizon_dependencies: List[Dict] = field(default_factory=list)
 
 
+# Horizon configuration is identical for every optimizer, so it is built once
+# and shared read-only.
+HORIZON_CONFIGS: Mapping[Horizon, HorizonConfig] = MappingProxyType({
+    Horizon.IMMEDIATE: HorizonConfig(
+        horizon=Horizon.IMMEDIATE,
+        label="Immediate Actions (0-30 days)",
+        min_days=0,
+        max_days=30,
+        budget_fraction_min=0.1,
+        budget_fraction_max=0.4,
+        budget_fraction_recommended=0.25,
+        preferred_categories=(StrategyCategory.PROCESS, StrategyCategory.POLICY),
+        max_complexity="low",
+        primary_objective="quick_wins"
+    ),
+    Horizon.TACTICAL: HorizonConfig(
+        horizon=Horizon.TACTICAL,
+        label="Tactical Improvements (30-180 days)",
+        min_days=30,
+        max_days=180,
+        budget_fraction_min=0.3,
+        budget_fraction_max=0.5,
+        budget_fraction_recommended=0.45,
+        preferred_categories=(StrategyCategory.TRAINING, StrategyCategory.MAINTENANCE),
+        max_complexity="medium",
+        primary_objective="risk_reduction"
+    ),
+    Horizon.STRATEGIC: HorizonConfig(
+        horizon=Horizon.STRATEGIC,
+        label="Strategic Investments (180+ days)",
+        min_days=180,
+        max_days=730,  # Up to 2 years
+        budget_fraction_min=0.2,
+        budget_fraction_max=0.5,
+        budget_fraction_recommended=0.30,
+        preferred_categories=(StrategyCategory.TECHNOLOGY,),
+        max_complexity="high",
+        primary_objective="transformation"
+    ),
+})
+
+
+# Action item prefix per horizon
+ACTION_ITEM_PREFIXES: Mapping[Horizon, str] = MappingProxyType({
+    Horizon.IMMEDIATE: "⚡ START NOW: ",
+    Horizon.TACTICAL: "📋 PLAN Q1/Q2: ",
+    Horizon.STRATEGIC: "🎯 BUDGET FY: ",
+})
+
+
+# ============================================
+# SELECTION KERNEL
+# ============================================
+
+# Explicit signature: with Numba installed the kernel is compiled when the
+# module is imported (and cached on disk), not on the first brief request.
+@njit("Tuple((boolean[:], float64))(float64[:], float64)", cache=True)
+def _greedy_select(costs, budget):
+    """Greedy budget fill over priority-sorted costs; returns (mask, total)."""
+    selected = np.zeros(costs.shape[0], dtype=np.bool_)
+    total = 0.0
+    for i in range(costs.shape[0]):
+        if total + costs[i] <= budget:
+            selected[i] = True
+            total += costs[i]
+    return selected, total
+
+
 # ============================================
 # MULTI-HORIZON OPTIMIZER
 # ============================================
@@ -117,6 +188,16 @@ class MultiHorizonOptimizer:
     And showing trade-offs between short-term patches vs long-term solutions.
     """
     
+    __slots__ = (
+        "strategies",
+        "total_budget",
+        "risk_score",
+        "horizons",
+        "strategy_horizons",
+        "_ranked_cache",
+        "_ranked_lock",
+    )
+    
     def __init__(
         self,
         strategies: List[Strategy],
@@ -128,51 +209,15 @@ class MultiHorizonOptimizer:
         self.risk_score = risk_score
         
         # Configure horizons
-        self.horizons = self._configure_horizons()
+        self.horizons = HORIZON_CONFIGS
         
         # Classify strategies by horizon suitability
         self.strategy_horizons = self._classify_strategies()
-    
-    def _configure_horizons(self) -> Dict[Horizon, HorizonConfig]:
-        """Configure each time horizon."""
-        return {
-            Horizon.IMMEDIATE: HorizonConfig(
-                horizon=Horizon.IMMEDIATE,
-                label="Immediate Actions (0-30 days)",
-                min_days=0,
-                max_days=30,
-                budget_fraction_min=0.1,
-                budget_fraction_max=0.4,
-                budget_fraction_recommended=0.25,
-                preferred_categories=[StrategyCategory.PROCESS, StrategyCategory.POLICY],
-                max_complexity="low",
-                primary_objective="quick_wins"
-            ),
-            Horizon.TACTICAL: HorizonConfig(
-                horizon=Horizon.TACTICAL,
-                label="Tactical Improvements (30-180 days)",
-                min_days=30,
-                max_days=180,
-                budget_fraction_min=0.3,
-                budget_fraction_max=0.5,
-                budget_fraction_recommended=0.45,
-                preferred_categories=[StrategyCategory.TRAINING, StrategyCategory.MAINTENANCE],
-                max_complexity="medium",
-                primary_objective="risk_reduction"
-            ),
-            Horizon.STRATEGIC: HorizonConfig(
-                horizon=Horizon.STRATEGIC,
-                label="Strategic Investments (180+ days)",
-                min_days=180,
-                max_days=730,  # Up to 2 years
-                budget_fraction_min=0.2,
-                budget_fraction_max=0.5,
-                budget_fraction_recommended=0.30,
-                preferred_categories=[StrategyCategory.TECHNOLOGY],
-                max_complexity="high",
-                primary_objective="transformation"
-            ),
-        }
+        
+        # Priority-sorted suitable strategies per horizon (see _ranked_for_horizon);
+        # the lock covers cache reads/writes so one optimizer can serve threads
+        self._ranked_cache: Dict[Horizon, List[Strategy]] = {}
+        self._ranked_lock = threading.Lock()
     
     def _classify_strategies(self) -> Dict[str, List[Horizon]]:
         """Classify each strategy by suitable horizons."""
@@ -202,21 +247,24 @@ class MultiHorizonOptimizer:
         
         return classification
     
-    def optimize_horizon(
-        self,
-        horizon: Horizon,
-        budget: float,
-        excluded_strategies: List[str] = None
-    ) -> HorizonPlan:
-        """Optimize for a single horizon."""
+    def _ranked_for_horizon(self, horizon: Horizon) -> List[Strategy]:
+        """
+        Strategies suitable for a horizon, sorted by priority.
+        
+        The order only depends on the strategy set and the horizon config,
+        so it is computed once per horizon and reused across calls.
+        """
+        with self._ranked_lock:
+            ranked = self._ranked_cache.get(horizon)
+        if ranked is not None:
+            return ranked
+        
         config = self.horizons[horizon]
-        excluded = excluded_strategies or []
         
         # Filter strategies suitable for this horizon
-        suitable_strategies = [
+        ranked = [
             s for s in self.strategies
-            if s.id not in excluded
-            and horizon in self.strategy_horizons.get(s.id, [])
+            if horizon in self.strategy_horizons.get(s.id, [])
             and s.time_estimate <= config.max_days
         ]
         
@@ -226,30 +274,42 @@ class MultiHorizonOptimizer:
             efficiency = s.risk_reduction_pct / s.cost_estimate if s.cost_estimate > 0 else 0
             return efficiency * category_bonus
         
-        suitable_strategies.sort(key=priority_score, reverse=True)
-        
-        # Greedy selection within budget
-        selected = []
-        total_cost = 0
-        
-        for strategy in suitable_strategies:
-            if total_cost + strategy.cost_estimate <= budget:
-                selected.append(strategy)
-                total_cost += strategy.cost_estimate
-        
+        ranked.sort(key=priority_score, reverse=True)
+        with self._ranked_lock:
+            # Keep the first stored order if another thread raced us here
+            ranked = self._ranked_cache.setdefault(horizon, ranked)
+        return ranked
+    
+    def _rank_strategies(
+        self,
+        horizon: Horizon,
+        excluded_strategies: Optional[Set[str]] = None
+    ) -> List[Strategy]:
+        """Priority-sorted strategies for a horizon, minus excluded ones."""
+        ranked = self._ranked_for_horizon(horizon)
+        if not excluded_strategies:
+            return list(ranked)
+        excluded = (
+            excluded_strategies if isinstance(excluded_strategies, (set, frozenset))
+            else set(excluded_strategies)
+        )
+        # Sort is stable, so filtering the cached order matches sorting the subset
+        return [s for s in ranked if s.id not in excluded]
+    
+    def _build_horizon_plan(
+        self,
+        horizon: Horizon,
+        selected: List[Strategy],
+        total_cost: float
+    ) -> HorizonPlan:
+        """Assemble a HorizonPlan from the selected strategies."""
         # Calculate outcomes
         risk_reduction = sum(s.risk_reduction_pct for s in selected)
         timeline = max((s.time_estimate for s in selected), default=0)
         
         # Generate action items
-        action_items = []
-        for s in selected:
-            if horizon == Horizon.IMMEDIATE:
-                action_items.append(f"⚡ START NOW: {s.name}")
-            elif horizon == Horizon.TACTICAL:
-                action_items.append(f"📋 PLAN Q1/Q2: {s.name}")
-            else:
-                action_items.append(f"🎯 BUDGET FY: {s.name}")
+        prefix = ACTION_ITEM_PREFIXES[horizon]
+        action_items = [prefix + s.name for s in selected]
         
         return HorizonPlan(
             horizon=horizon,
@@ -261,6 +321,58 @@ class MultiHorizonOptimizer:
             decision_deadline=self._get_decision_deadline(horizon)
         )
     
+    def optimize_horizon(
+        self,
+        horizon: Horizon,
+        budget: float,
+        excluded_strategies: Optional[Set[str]] = None
+    ) -> HorizonPlan:
+        """Optimize for a single horizon."""
+        suitable_strategies = self._rank_strategies(horizon, excluded_strategies)
+        
+        # Greedy selection within budget
+        costs = np.array([s.cost_estimate for s in suitable_strategies], dtype=np.float64)
+        mask, total_cost = _greedy_select(costs, float(budget))
+        selected = [s for s, keep in zip(suitable_strategies, mask) if keep]
+        
+        return self._build_horizon_plan(horizon, selected, float(total_cost))
+    
+    def optimize_horizon_batch(
+        self,
+        horizon: Horizon,
+        budgets: np.ndarray,
+        excluded_strategies: Optional[Set[str]] = None
+    ) -> List[HorizonPlan]:
+        """
+        Optimize a single horizon for many candidate budgets at once.
+        
+        Equivalent to calling optimize_horizon once per budget, but the
+        strategies are filtered and sorted only once and the greedy pass
+        runs over all budgets together (one vector step per strategy).
+        Useful for budget sensitivity sweeps.
+        """
+        budgets = np.asarray(budgets, dtype=np.float64).ravel()
+        ranked = self._rank_strategies(horizon, excluded_strategies)
+        costs = np.array([s.cost_estimate for s in ranked], dtype=np.float64)
+        
+        # selected[k, j] is True when ranked strategy j is funded under budget k
+        selected = np.zeros((budgets.size, costs.size), dtype=bool)
+        spent = np.zeros(budgets.size)
+        
+        for j, cost in enumerate(costs):
+            fits = spent + cost <= budgets
+            selected[:, j] = fits
+            spent[fits] += cost
+        
+        return [
+            self._build_horizon_plan(
+                horizon,
+                [ranked[j] for j in np.flatnonzero(row)],
+                float(total_cost)
+            )
+            for row, total_cost in zip(selected, spent)
+        ]
+    
     def _get_decision_deadline(self, horizon: Horizon) -> str:
         """Get decision deadline based on horizon."""
         if horizon == Horizon.IMMEDIATE:
@@ -272,7 +384,8 @@ class MultiHorizonOptimizer:
     
     def optimize_all_horizons(
         self,
-        budget_allocation: Dict[Horizon, float] = None
+        budget_allocation: Dict[Horizon, float] = None,
+        preselected: Optional[List[Strategy]] = None
     ) -> MultiHorizonPlan:
         """
         Optimize across all three horizons.
@@ -280,6 +393,9 @@ class MultiHorizonOptimizer:
         Args:
             budget_allocation: Optional custom budget per horizon.
                              If None, uses recommended fractions.
+            preselected: Optional pre-pruned pool (e.g. the strategies of an
+                         already-solved portfolio). Only these strategies
+                         are phased across horizons.
         """
         if budget_allocation is None:
             budget_allocation = {
@@ -288,7 +404,13 @@ class MultiHorizonOptimizer:
                 Horizon.STRATEGIC: self.total_budget * 0.30,
             }
         
-        used_strategies = []
+        # Strategies outside the preselected pool are excluded up front
+        used_strategies: Set[str] = set()
+        if preselected is not None:
+            preselected_ids = {s.id for s in preselected}
+            used_strategies.update(
+                s.id for s in self.strategies if s.id not in preselected_ids
+            )
         
         # Optimize immediate first (highest urgency)
         immediate = self.optimize_horizon(
@@ -296,7 +418,7 @@ class MultiHorizonOptimizer:
             budget_allocation[Horizon.IMMEDIATE],
             excluded_strategies=used_strategies
         )
-        used_strategies.extend([s.id for s in immediate.strategies])
+        used_strategies.update(s.id for s in immediate.strategies)
         
         # Optimize tactical
         tactical = self.optimize_horizon(
@@ -304,7 +426,7 @@ class MultiHorizonOptimizer:
             budget_allocation[Horizon.TACTICAL],
             excluded_strategies=used_strategies
         )
-        used_strategies.extend([s.id for s in tactical.strategies])
+        used_strategies.update(s.id for s in tactical.strategies)
         
         # Optimize strategic
         strategic = self.optimize_horizon(
@@ -313,15 +435,19 @@ class MultiHorizonOptimizer:
             excluded_strategies=used_strategies
         )
         
-        # Calculate totals
-        total_cost = immediate.total_cost + tactical.total_cost + strategic.total_cost
+        # Calculate totals (sustainable = tactical + strategic, computed once)
+        sustainable_value = tactical.risk_reduction + strategic.risk_reduction
+        sustainable_cost = tactical.total_cost + strategic.total_cost
+        total_cost = immediate.total_cost + sustainable_cost
         total_risk_reduction = min(
-            immediate.risk_reduction + tactical.risk_reduction + strategic.risk_reduction,
+            immediate.risk_reduction + sustainable_value,
             95  # Cap at 95%
         )
         
         # Analyze trade-offs
-        tradeoff = self._analyze_tradeoffs(immediate, tactical, strategic)
+        tradeoff = self._analyze_tradeoffs(
+            immediate, tactical, strategic, sustainable_value, sustainable_cost
+        )
         
         # Generate phase sequence
         phases = self._generate_phase_sequence(immediate, tactical, strategic)
@@ -344,22 +470,28 @@ class MultiHorizonOptimizer:
         self,
         immediate: HorizonPlan,
         tactical: HorizonPlan,
-        strategic: HorizonPlan
+        strategic: HorizonPlan,
+        sustainable_value: Optional[float] = None,
+        sustainable_cost: Optional[float] = None
     ) -> Dict:
         """Analyze trade-offs between horizons."""
+        if sustainable_value is None:
+            sustainable_value = tactical.risk_reduction + strategic.risk_reduction
+        if sustainable_cost is None:
+            sustainable_cost = tactical.total_cost + strategic.total_cost
+        
         return {
             "quick_fix_value": immediate.risk_reduction,
             "quick_fix_cost": immediate.total_cost,
-            "sustainable_value": tactical.risk_reduction + strategic.risk_reduction,
-            "sustainable_cost": tactical.total_cost + strategic.total_cost,
+            "sustainable_value": sustainable_value,
+            "sustainable_cost": sustainable_cost,
             "quick_fix_cost_effectiveness": (
                 immediate.risk_reduction / immediate.total_cost * 1000 
                 if immediate.total_cost > 0 else 0
             ),
             "sustainable_cost_effectiveness": (
-                (tactical.risk_reduction + strategic.risk_reduction) / 
-                (tactical.total_cost + strategic.total_cost) * 1000
-                if (tactical.total_cost + strategic.total_cost) > 0 else 0
+                sustainable_value / sustainable_cost * 1000
+                if sustainable_cost > 0 else 0
             ),
             "recommendation": self._tradeoff_recommendation(immediate, tactical, strategic)
         }
@@ -385,51 +517,38 @@ class MultiHorizonOptimizer:
         strategic: HorizonPlan
     ) -> List[Dict]:
         """Generate implementation phase sequence."""
-        phases = []
-        
-        # Phase 1: Immediate
-        if immediate.strategies:
-            phases.append({
-                "phase": 1,
-                "name": "Crisis Response / Quick Wins",
-                "horizon": "immediate",
-                "start_day": 0,
-                "end_day": 30,
-                "strategies": [s.name for s in immediate.strategies],
-                "cost": immediate.total_cost,
-                "expected_risk_reduction": immediate.risk_reduction,
-                "milestone": f"Achieve {immediate.risk_reduction:.0f}% risk reduction"
-            })
-        
-        # Phase 2: Tactical
-        if tactical.strategies:
-            phases.append({
-                "phase": 2,
-                "name": "Systematic Improvement",
-                "horizon": "tactical",
-                "start_day": 30,
-                "end_day": 180,
-                "strategies": [s.name for s in tactical.strategies],
-                "cost": tactical.total_cost,
-                "expected_risk_reduction": tactical.risk_reduction,
-                "milestone": f"Cumulative {immediate.risk_reduction + tactical.risk_reduction:.0f}% reduction"
-            })
-        
-        # Phase 3: Strategic
-        if strategic.strategies:
-            phases.append({
-                "phase": 3,
-                "name": "Transformational Investment",
-                "horizon": "strategic",
-                "start_day": 180,
-                "end_day": 365,
-                "strategies": [s.name for s in strategic.strategies],
-                "cost": strategic.total_cost,
-                "expected_risk_reduction": strategic.risk_reduction,
-                "milestone": f"Target {immediate.risk_reduction + tactical.risk_reduction + strategic.risk_reduction:.0f}% total reduction"
-            })
-        
-        return phases
+        cumulative = (
+            immediate.risk_reduction,
+            immediate.risk_reduction + tactical.risk_reduction,
+            immediate.risk_reduction + tactical.risk_reduction + strategic.risk_reduction,
+        )
+        
+        # (phase, name, horizon plan, start_day, end_day, milestone template);
+        # milestones are only formatted for phases that have strategies
+        phase_specs = (
+            (1, "Crisis Response / Quick Wins", immediate, 0, 30,
+             "Achieve {:.0f}% risk reduction"),
+            (2, "Systematic Improvement", tactical, 30, 180,
+             "Cumulative {:.0f}% reduction"),
+            (3, "Transformational Investment", strategic, 180, 365,
+             "Target {:.0f}% total reduction"),
+        )
+        
+        return [
+            {
+                "phase": phase,
+                "name": name,
+                "horizon": plan.horizon.value,
+                "start_day": start_day,
+                "end_day": end_day,
+                "strategies": [s.name for s in plan.strategies],
+                "cost": plan.total_cost,
+                "expected_risk_reduction": plan.risk_reduction,
+                "milestone": milestone.format(cumulative[phase - 1])
+            }
+            for phase, name, plan, start_day, end_day, milestone in phase_specs
+            if plan.strategies
+        ]
     
     def _identify_dependencies(
         self,
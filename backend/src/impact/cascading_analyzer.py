@@ -14,12 +14,15 @@ Date: January 2026
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Mapping, Optional, Tuple
+from types import MappingProxyType
 from enum import Enum
 import numpy as np
 import logging
+import threading
 
-from src.core.optimizer import Strategy, OptimizationResult
+from src.core.optimizer import Strategy, OptimizationResult, StrategyCategory
+from src.core.jit import njit
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,7 +46,16 @@ class ImpactCategory(Enum):
     COMPLIANCE = "compliance"   # Regulatory, audit
 
 
-@dataclass
+# Dollar formatter shared by effect values and impact trees
+fmt_money = "${:,.0f}".format
+
+# Integer order values, compared instead of ImpactOrder members on hot paths
+_FIRST_ORDER = ImpactOrder.FIRST.value
+_SECOND_ORDER = ImpactOrder.SECOND.value
+_THIRD_ORDER = ImpactOrder.THIRD.value
+
+
+@dataclass(slots=True)
 class ImpactEffect:
     """A single impact effect."""
     effect_id: str
@@ -66,6 +78,15 @@ class ImpactEffect:
     # Business context
     mitigation: Optional[str] = None  # How to mitigate
     mitigation_cost: float = 0
+    
+    _value_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def value_str(self) -> str:
+        """Value formatted as dollars, cached after first use."""
+        if self._value_str is None:
+            self._value_str = fmt_money(self.value)
+        return self._value_str
 
 
 @dataclass
@@ -88,7 +109,18 @@ class CascadeChain:
         return max((e.order.value for e in self.chain), default=0)
 
 
-@dataclass
+# Justification templates for TotalCostAnalysis
+_JUSTIFICATION_RECOMMENDED = (
+    "Strategy costs ${total:,.0f} (direct: ${direct:,.0f} + hidden: ${hidden:,.0f}), "
+    "but prevents ${avoided:,.0f} in incident costs. Net benefit: ${net:,.0f}."
+)
+_JUSTIFICATION_RECONSIDER = (
+    "Total cost ${total:,.0f} exceeds avoided incident cost ${avoided:,.0f}. "
+    "Consider alternatives."
+)
+
+
+@dataclass(slots=True)
 class TotalCostAnalysis:
     """Complete cost analysis including all orders of effects."""
     strategy_id: str
@@ -112,12 +144,174 @@ class TotalCostAnalysis:
     # Comparison
     cost_multiplier: float  # total / direct
     
-    # Effects detail
-    effects: List[ImpactEffect] = field(default_factory=list)
-    
-    # Justification
+    # Justification inputs (the text itself is built lazily, see `justification`)
     still_recommended: bool = True
-    justification: str = ""
+    avoided_incident_cost: float = 0.0
+    
+    # Effects detail as raw (order, category, value, description) records;
+    # ImpactEffect objects are only built when `effects` is read
+    effect_records: List[Tuple[ImpactOrder, ImpactCategory, float, str]] = field(
+        default_factory=list, repr=False
+    )
+    _effects: Optional[List[ImpactEffect]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _second_order_effects: Optional[List[ImpactEffect]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _third_order_effects: Optional[List[ImpactEffect]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _justification: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def justification(self) -> str:
+        """Recommendation rationale, formatted on first access and cached."""
+        if self._justification is None:
+            template = (
+                _JUSTIFICATION_RECOMMENDED if self.still_recommended
+                else _JUSTIFICATION_RECONSIDER
+            )
+            self._justification = template.format_map({
+                "total": self.total_cost_of_ownership,
+                "direct": self.direct_cost,
+                "hidden": self.hidden_costs,
+                "avoided": self.avoided_incident_cost,
+                "net": self.avoided_incident_cost - self.total_cost_of_ownership,
+            })
+        return self._justification
+    
+    @property
+    def effects(self) -> List[ImpactEffect]:
+        """Effects detail, materialized from effect_records on first access."""
+        if self._effects is None:
+            self._effects = [
+                ImpactEffect(
+                    effect_id=(
+                        f"{self.strategy_id}_DIRECT" if order.value == _FIRST_ORDER
+                        else f"{self.strategy_id}_{order.name}_{i}"
+                    ),
+                    description=description,
+                    order=order,
+                    category=category,
+                    metric="cost",
+                    value=value,
+                    unit="$"
+                )
+                for i, (order, category, value, description) in enumerate(self.effect_records)
+            ]
+        return self._effects
+    
+    @property
+    def second_order_effects(self) -> List[ImpactEffect]:
+        """Second-order (ripple) effects, partitioned once and cached."""
+        if self._second_order_effects is None:
+            self._partition_effects()
+        return self._second_order_effects
+    
+    @property
+    def third_order_effects(self) -> List[ImpactEffect]:
+        """Third-order (systemic) effects, partitioned once and cached."""
+        if self._third_order_effects is None:
+            self._partition_effects()
+        return self._third_order_effects
+    
+    def _partition_effects(self) -> None:
+        """Split effects by order in a single pass, comparing integer order values."""
+        second, third = [], []
+        for effect in self.effects:
+            order = effect.order.value
+            if order == _SECOND_ORDER:
+                second.append(effect)
+            elif order == _THIRD_ORDER:
+                third.append(effect)
+        self._second_order_effects = second
+        self._third_order_effects = third
+
+
+# Cost formulas for compiled effects
+COST_FIXED = 0        # cost = const
+COST_PCT_OF_DIRECT = 1  # cost = strategy.cost_estimate * const
+
+
+@dataclass(slots=True)
+class CompiledEffect:
+    """An impact rule effect with organizational params resolved to numbers."""
+    order: ImpactOrder
+    category: ImpactCategory
+    description: str
+    
+    # Trigger: fires when the strategy exceeds both thresholds
+    risk_threshold: float
+    cost_threshold: float
+    
+    # Cost formula
+    cost_fn_id: int
+    const: float
+    
+    # Flat index into the (order, impact category) accumulator
+    acc_slot: int
+
+
+# ============================================
+# TCO KERNEL
+# ============================================
+
+# Rule table columns for _compute_tco (one row per compiled effect)
+RULE_CAT, RULE_RISK_THRESHOLD, RULE_COST_THRESHOLD, RULE_ORDER, RULE_IMPACT_CATEGORY, \
+    RULE_CONST_COST, RULE_COEFF_COST = range(7)
+
+# Integer codes for ImpactCategory in the rule table
+IMPACT_CATEGORY_CODES = {category: code for code, category in enumerate(ImpactCategory)}
+_RESOURCE_CODE = IMPACT_CATEGORY_CODES[ImpactCategory.RESOURCE]
+_OPERATIONAL_CODE = IMPACT_CATEGORY_CODES[ImpactCategory.OPERATIONAL]
+
+# analyze_strategy accumulates costs in a flat [order][impact category] list
+_N_IMPACT_CATEGORIES = len(ImpactCategory)
+_ACC_SIZE = len(ImpactOrder) * _N_IMPACT_CATEGORIES
+
+
+@njit(cache=True)
+def _compute_tco(risk_pct, cost, cat_id, rule_table):
+    """
+    Per-strategy cascading costs for a portfolio.
+    
+    Returns (second, third, resource, operational, tco) arrays. Works on
+    plain NumPy when Numba is not installed (one vector pass per rule row).
+    Thresholds may be -inf, so this is not compiled with fastmath.
+    """
+    n = risk_pct.shape[0]
+    second = np.zeros(n)
+    third = np.zeros(n)
+    resource = np.zeros(n)
+    operational = np.zeros(n)
+    
+    for j in range(rule_table.shape[0]):
+        hit = (
+            (cat_id == int(rule_table[j, RULE_CAT]))
+            & (risk_pct > rule_table[j, RULE_RISK_THRESHOLD])
+            & (cost > rule_table[j, RULE_COST_THRESHOLD])
+        )
+        value = np.where(
+            hit, rule_table[j, RULE_CONST_COST] + rule_table[j, RULE_COEFF_COST] * cost, 0.0
+        )
+        
+        order = int(rule_table[j, RULE_ORDER])
+        if order == _SECOND_ORDER:
+            second += value
+        elif order == _THIRD_ORDER:
+            third += value
+        
+        impact_category = int(rule_table[j, RULE_IMPACT_CATEGORY])
+        if impact_category == _RESOURCE_CODE:
+            resource += value
+        elif impact_category == _OPERATIONAL_CODE:
+            operational += value
+    
+    tco = cost + second + third
+    return second, third, resource, operational, tco
 
 
 # ============================================
@@ -146,189 +340,263 @@ class CascadingImpactAnalyzer:
     - Requires quality control enhancement: +$30K
     """
     
+    # Max memoized analyses kept per analyzer (oldest evicted first)
+    ANALYSIS_CACHE_SIZE = 1024
+    
+    # Default organizational parameters (shared, read-only)
+    _DEFAULT_PARAMS: Mapping[str, float] = MappingProxyType({
+        # Resource utilization
+        "maintenance_bay_utilization": 0.75,
+        "maintenance_bay_capacity_threshold": 0.90,
+        "technician_hourly_cost": 75,
+        "technician_annual_cost": 150000,
+        "hiring_time_days": 60,
+        
+        # Operations
+        "fleet_size": 50,
+        "daily_flights_per_aircraft": 4,
+        "revenue_per_flight": 15000,
+        "aog_cost_per_day": 50000,  # Aircraft on ground
+        
+        # Training
+        "training_hours_per_person": 8,
+        "training_cost_per_hour": 100,
+        "productivity_loss_during_training": 0.3,
+        
+        # Supply chain
+        "parts_inventory_buffer_weeks": 4,
+        "parts_cost_per_maintenance": 5000,
+        "bulk_discount_threshold": 1.25,  # 25% volume increase
+        "bulk_discount_rate": 0.15,
+        
+        # Human factors
+        "overtime_fatigue_threshold": 0.15,  # 15% overtime = fatigue concern
+        "fatigue_quality_impact": 0.03,  # 3% quality degradation
+    })
+    
     def __init__(
         self,
         organizational_params: Dict = None
     ):
-        self.params = organizational_params or self._default_params()
+        self.params = self._resolve_params(organizational_params)
         
-        # Impact rules library
-        self.impact_rules = self._build_impact_rules()
+        # Impact rules library, compiled per strategy category for the hot path
+        self._load_rules()
+        
+        # Memoized analyses keyed by strategy fingerprint (see analyze_strategy);
+        # the lock covers cache reads/writes so one analyzer can serve threads
+        self._analysis_cache: Dict[Tuple, TotalCostAnalysis] = {}
+        self._cache_lock = threading.Lock()
     
-    def _default_params(self) -> Dict:
-        """Default organizational parameters."""
-        return {
-            # Resource utilization
-            "maintenance_bay_utilization": 0.75,
-            "maintenance_bay_capacity_threshold": 0.90,
-            "technician_hourly_cost": 75,
-            "technician_annual_cost": 150000,
-            "hiring_time_days": 60,
-            
-            # Operations
-            "fleet_size": 50,
-            "daily_flights_per_aircraft": 4,
-            "revenue_per_flight": 15000,
-            "aog_cost_per_day": 50000,  # Aircraft on ground
-            
-            # Training
-            "training_hours_per_person": 8,
-            "training_cost_per_hour": 100,
-            "productivity_loss_during_training": 0.3,
-            
-            # Supply chain
-            "parts_inventory_buffer_weeks": 4,
-            "parts_cost_per_maintenance": 5000,
-            "bulk_discount_threshold": 1.25,  # 25% volume increase
-            "bulk_discount_rate": 0.15,
-            
-            # Human factors
-            "overtime_fatigue_threshold": 0.15,  # 15% overtime = fatigue concern
-            "fatigue_quality_impact": 0.03,  # 3% quality degradation
+    def update_params(self, organizational_params: Dict) -> None:
+        """Replace organizational params, recompile rules and drop cached analyses."""
+        self.params = self._resolve_params(organizational_params)
+        self._load_rules()
+        with self._cache_lock:
+            self._analysis_cache.clear()
+    
+    @classmethod
+    def _resolve_params(cls, organizational_params: Optional[Dict]) -> Mapping[str, float]:
+        """Shared defaults when no overrides are given, else a merged copy."""
+        if not organizational_params:
+            return cls._DEFAULT_PARAMS
+        return {**cls._DEFAULT_PARAMS, **organizational_params}
+    
+    def _load_rules(self) -> None:
+        """Build and compile the rule library from the current params."""
+        self.impact_rules = self._build_impact_rules(self.params)
+        self._compiled_rules = self._compile_rules(self.impact_rules)
+        
+        # Integer category codes and flat rule table for the vectorized portfolio path
+        self._category_codes = {
+            category: code for code, category in enumerate(self._compiled_rules)
         }
+        self._rule_table = np.array([
+            (
+                self._category_codes[category],
+                eff.risk_threshold,
+                eff.cost_threshold,
+                eff.order.value,
+                IMPACT_CATEGORY_CODES[eff.category],
+                eff.const if eff.cost_fn_id == COST_FIXED else 0.0,
+                eff.const if eff.cost_fn_id == COST_PCT_OF_DIRECT else 0.0,
+            )
+            for category, effects in self._compiled_rules.items()
+            for eff in effects
+        ], dtype=np.float64).reshape(-1, 7)
     
-    def _build_impact_rules(self) -> List[Dict]:
-        """Build library of impact rules."""
+    def _build_impact_rules(self, p: Optional[Mapping[str, float]] = None) -> List[Dict]:
+        """
+        Build library of impact rules.
+        
+        Rules are plain data: organizational params (`p`, defaulting to
+        self.params) are read once here and baked into the rule values, and a
+        rule fires when the strategy attribute exceeds each trigger value.
+        """
+        if p is None:
+            p = self.params
+        new_bay_utilization = p["maintenance_bay_utilization"] + 0.19
+        
         return [
             # Maintenance strategy impacts
             {
                 "strategy_category": "maintenance",
-                "trigger_condition": lambda s, p: s.risk_reduction_pct > 15,
+                "trigger": {"risk_reduction_pct": 15},
                 "effects": [
                     {
                         "order": ImpactOrder.SECOND,
                         "category": ImpactCategory.RESOURCE,
                         "description": "Maintenance bay capacity impact",
-                        "calculate": lambda s, p: {
-                            "new_utilization": min(1.0, p["maintenance_bay_utilization"] + 0.19),
-                            "needs_expansion": p["maintenance_bay_utilization"] + 0.19 > p["maintenance_bay_capacity_threshold"]
-                        }
+                        "cost": 0,  # Utilization rises to min(1.0, new_bay_utilization)
                     },
                     {
                         "order": ImpactOrder.SECOND,
                         "category": ImpactCategory.FINANCIAL,
                         "description": "Additional technician hiring",
-                        "condition": lambda calc: calc.get("needs_expansion", False),
-                        "calculate": lambda s, p: {
-                            "fte_needed": 2,
-                            "cost": 2 * p["technician_annual_cost"],
-                            "timeline_extension": p["hiring_time_days"]
-                        }
+                        # Only when the bay needs expansion; 2 FTE, hiring_time_days delay
+                        "condition": new_bay_utilization > p["maintenance_bay_capacity_threshold"],
+                        "cost": 2 * p["technician_annual_cost"],
                     },
                 ]
             },
             # Training strategy impacts
             {
                 "strategy_category": "training",
-                "trigger_condition": lambda s, p: s.risk_reduction_pct > 10,
+                "trigger": {"risk_reduction_pct": 10},
                 "effects": [
                     {
                         "order": ImpactOrder.SECOND,
                         "category": ImpactCategory.OPERATIONAL,
                         "description": "Training schedule productivity loss",
-                        "calculate": lambda s, p: {
-                            "productivity_loss_pct": p["productivity_loss_during_training"],
-                            "cost": p["training_hours_per_person"] * p["training_cost_per_hour"] * 50  # 50 staff
-                        }
+                        "cost": p["training_hours_per_person"] * p["training_cost_per_hour"] * 50,  # 50 staff
                     }
                 ]
             },
             # Technology strategy impacts
             {
                 "strategy_category": "technology",
-                "trigger_condition": lambda s, p: s.cost_estimate > 200000,
+                "trigger": {"cost_estimate": 200000},
                 "effects": [
                     {
                         "order": ImpactOrder.SECOND,
                         "category": ImpactCategory.ORGANIZATIONAL,
                         "description": "Change management and user training",
-                        "calculate": lambda s, p: {
-                            "cost": s.cost_estimate * 0.20,  # 20% of tech cost
-                            "timeline_extension": 30
-                        }
+                        "cost_pct_of_direct": 0.20,  # 20% of tech cost, +30 days
                     },
                     {
                         "order": ImpactOrder.THIRD,
                         "category": ImpactCategory.OPERATIONAL,
                         "description": "Initial productivity dip during transition",
-                        "calculate": lambda s, p: {
-                            "productivity_dip_weeks": 4,
-                            "cost": 4 * 5 * p["revenue_per_flight"] * 0.05  # 5% revenue impact for 4 weeks
-                        }
+                        "cost": 4 * 5 * p["revenue_per_flight"] * 0.05,  # 5% revenue impact for 4 weeks
                     }
                 ]
             },
         ]
     
+    def _compile_rules(
+        self,
+        rules: List[Dict]
+    ) -> Dict[StrategyCategory, Tuple[CompiledEffect, ...]]:
+        """
+        Flatten the rule library into per-category tuples of CompiledEffect.
+        
+        Keyed by StrategyCategory member so lookups skip the enum `.value`.
+        """
+        compiled: Dict[StrategyCategory, List[CompiledEffect]] = {}
+        
+        for rule in rules:
+            trigger = rule["trigger"]
+            risk_threshold = float(trigger.get("risk_reduction_pct", float("-inf")))
+            cost_threshold = float(trigger.get("cost_estimate", float("-inf")))
+            category_effects = compiled.setdefault(StrategyCategory(rule["strategy_category"]), [])
+            
+            for effect_def in rule["effects"]:
+                if not effect_def.get("condition", True):
+                    continue
+                
+                if "cost_pct_of_direct" in effect_def:
+                    cost_fn_id, const = COST_PCT_OF_DIRECT, effect_def["cost_pct_of_direct"]
+                else:
+                    cost_fn_id, const = COST_FIXED, effect_def.get("cost", 0)
+                
+                category_effects.append(CompiledEffect(
+                    order=effect_def["order"],
+                    category=effect_def["category"],
+                    description=effect_def["description"],
+                    risk_threshold=risk_threshold,
+                    cost_threshold=cost_threshold,
+                    cost_fn_id=cost_fn_id,
+                    const=const,
+                    acc_slot=(
+                        (effect_def["order"].value - _FIRST_ORDER) * _N_IMPACT_CATEGORIES
+                        + IMPACT_CATEGORY_CODES[effect_def["category"]]
+                    )
+                ))
+        
+        return {category: tuple(effects) for category, effects in compiled.items()}
+    
     def analyze_strategy(
         self,
         strategy: Strategy,
-        include_third_order: bool = True
+        include_third_order: bool = True,
+        _Analysis=TotalCostAnalysis,
+        _First=ImpactOrder.FIRST,
+        _Finance=ImpactCategory.FINANCIAL,
+        _cost_fixed=COST_FIXED
     ) -> TotalCostAnalysis:
         """
         Analyze complete cost including cascading effects.
+        
+        Results are memoized per strategy fingerprint and shared between
+        callers, so treat the returned analysis as read-only. The underscore
+        keyword defaults pre-bind module globals as locals for the hot loop;
+        callers should not pass them.
         """
-        effects = []
-        second_order_cost = 0
-        third_order_cost = 0
-        resource_impact = 0
-        operational_impact = 0
+        key = (
+            strategy.id,
+            strategy.name,
+            strategy.category,
+            strategy.risk_reduction_pct,
+            strategy.cost_estimate
+        )
+        with self._cache_lock:
+            cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Cost per (order, impact category); direct cost is tracked separately
+        acc = [0] * _ACC_SIZE
         
         # First order effects (direct)
-        effects.append(ImpactEffect(
-            effect_id=f"{strategy.id}_DIRECT",
-            description=f"Direct implementation cost",
-            order=ImpactOrder.FIRST,
-            category=ImpactCategory.FINANCIAL,
-            metric="cost",
-            value=strategy.cost_estimate,
-            unit="$"
-        ))
-        
-        # Check each impact rule
-        for rule in self.impact_rules:
-            if strategy.category.value != rule["strategy_category"]:
-                continue
-            
-            if not rule["trigger_condition"](strategy, self.params):
+        effect_records = [(
+            _First,
+            _Finance,
+            strategy.cost_estimate,
+            "Direct implementation cost"
+        )]
+        
+        # Apply each compiled effect for this strategy's category
+        risk_pct = strategy.risk_reduction_pct
+        direct_cost = strategy.cost_estimate
+        
+        for eff in self._compiled_rules.get(strategy.category, ()):
+            if risk_pct <= eff.risk_threshold or direct_cost <= eff.cost_threshold:
                 continue
             
-            previous_calc = {}
+            if eff.cost_fn_id == _cost_fixed:
+                cost_value = eff.const
+            else:
+                cost_value = direct_cost * eff.const
             
-            for effect_def in rule["effects"]:
-                # Check condition if exists
-                if "condition" in effect_def:
-                    if not effect_def["condition"](previous_calc):
-                        continue
-                
-                # Calculate effect
-                calc_result = effect_def["calculate"](strategy, self.params)
-                previous_calc.update(calc_result)
-                
-                cost_value = calc_result.get("cost", 0)
-                
-                effect = ImpactEffect(
-                    effect_id=f"{strategy.id}_{effect_def['order'].name}_{len(effects)}",
-                    description=effect_def["description"],
-                    order=effect_def["order"],
-                    category=effect_def["category"],
-                    metric="cost",
-                    value=cost_value,
-                    unit="$"
-                )
-                effects.append(effect)
-                
-                # Accumulate by order
-                if effect_def["order"] == ImpactOrder.SECOND:
-                    second_order_cost += cost_value
-                elif effect_def["order"] == ImpactOrder.THIRD:
-                    third_order_cost += cost_value
-                
-                # Accumulate by category
-                if effect_def["category"] == ImpactCategory.RESOURCE:
-                    resource_impact += cost_value
-                elif effect_def["category"] == ImpactCategory.OPERATIONAL:
-                    operational_impact += cost_value
+            effect_records.append((eff.order, eff.category, cost_value, eff.description))
+            acc[eff.acc_slot] += cost_value
+        
+        # Reduce the accumulator by order (rows) and by category (columns)
+        n_cat = _N_IMPACT_CATEGORIES
+        second_order_cost = sum(acc[n_cat:2 * n_cat])
+        third_order_cost = sum(acc[2 * n_cat:])
+        resource_impact = sum(acc[_RESOURCE_CODE::n_cat])
+        operational_impact = sum(acc[_OPERATIONAL_CODE::n_cat])
         
         total_cost = strategy.cost_estimate + second_order_cost + third_order_cost
         hidden_costs = second_order_cost + third_order_cost
@@ -338,16 +606,7 @@ class CascadingImpactAnalyzer:
         avoided_cost = strategy.risk_reduction_pct * 100000
         still_recommended = avoided_cost > total_cost
         
-        justification = (
-            f"Strategy costs ${total_cost:,.0f} (direct: ${strategy.cost_estimate:,.0f} + "
-            f"hidden: ${hidden_costs:,.0f}), but prevents ${avoided_cost:,.0f} in incident costs. "
-            f"Net benefit: ${avoided_cost - total_cost:,.0f}."
-            if still_recommended else
-            f"Total cost ${total_cost:,.0f} exceeds avoided incident cost ${avoided_cost:,.0f}. "
-            f"Consider alternatives."
-        )
-        
-        return TotalCostAnalysis(
+        analysis = _Analysis(
             strategy_id=strategy.id,
             strategy_name=strategy.name,
             direct_cost=strategy.cost_estimate,
@@ -358,27 +617,79 @@ class CascadingImpactAnalyzer:
             operational_impact=operational_impact,
             hidden_costs=hidden_costs,
             cost_multiplier=total_cost / strategy.cost_estimate if strategy.cost_estimate > 0 else 1,
-            effects=effects,
             still_recommended=still_recommended,
-            justification=justification
+            avoided_incident_cost=avoided_cost,
+            effect_records=effect_records
+        )
+        
+        with self._cache_lock:
+            cache = self._analysis_cache
+            if len(cache) >= self.ANALYSIS_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = analysis
+        
+        return analysis
+    
+    def _analyze_totals_only(
+        self,
+        strategy: Strategy
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Cost totals for a strategy without building a TotalCostAnalysis.
+        
+        Returns (direct, second_order, third_order, resource, operational),
+        matching the corresponding analyze_strategy fields.
+        """
+        acc = [0] * _ACC_SIZE
+        risk_pct = strategy.risk_reduction_pct
+        direct_cost = strategy.cost_estimate
+        
+        for eff in self._compiled_rules.get(strategy.category, ()):
+            if risk_pct <= eff.risk_threshold or direct_cost <= eff.cost_threshold:
+                continue
+            if eff.cost_fn_id == COST_FIXED:
+                acc[eff.acc_slot] += eff.const
+            else:
+                acc[eff.acc_slot] += direct_cost * eff.const
+        
+        n_cat = _N_IMPACT_CATEGORIES
+        return (
+            direct_cost,
+            sum(acc[n_cat:2 * n_cat]),
+            sum(acc[2 * n_cat:]),
+            sum(acc[_RESOURCE_CODE::n_cat]),
+            sum(acc[_OPERATIONAL_CODE::n_cat])
         )
     
     def analyze_portfolio(
         self,
-        result: OptimizationResult
+        result: OptimizationResult,
+        include_analyses: bool = True
     ) -> Dict:
-        """Analyze cascading impacts for entire portfolio."""
+        """
+        Analyze cascading impacts for entire portfolio.
+        
+        With include_analyses=False only the totals are computed (no
+        per-strategy analyses are built) and "strategy_analyses" is empty.
+        """
         analyses = []
         total_direct = 0
         total_hidden = 0
         total_tco = 0
         
-        for strategy in result.selected_strategies:
-            analysis = self.analyze_strategy(strategy)
-            analyses.append(analysis)
-            total_direct += analysis.direct_cost
-            total_hidden += analysis.hidden_costs
-            total_tco += analysis.total_cost_of_ownership
+        if include_analyses:
+            for strategy in result.selected_strategies:
+                analysis = self.analyze_strategy(strategy)
+                analyses.append(analysis)
+                total_direct += analysis.direct_cost
+                total_hidden += analysis.hidden_costs
+                total_tco += analysis.total_cost_of_ownership
+        else:
+            for strategy in result.selected_strategies:
+                direct, second, third, _, _ = self._analyze_totals_only(strategy)
+                total_direct += direct
+                total_hidden += second + third
+                total_tco += direct + second + third
         
         return {
             "portfolio_size": len(result.selected_strategies),
@@ -392,6 +703,50 @@ class CascadingImpactAnalyzer:
             "summary": f"Portfolio costs ${total_direct:,.0f} on paper but TRUE total cost is ${total_tco:,.0f} when including ripple effects (${total_hidden:,.0f} hidden costs)."
         }
     
+    def analyze_portfolio_vectorized(
+        self,
+        result: OptimizationResult,
+        include_analyses: bool = True
+    ) -> Dict:
+        """
+        Vectorized analyze_portfolio for large portfolios.
+        
+        Portfolio totals are computed by the _compute_tco kernel over the flat
+        rule table (Numba-compiled when available, NumPy otherwise). As with
+        analyze_portfolio, include_analyses=False skips the per-strategy
+        analyses and leaves "strategy_analyses" empty.
+        """
+        strategies = result.selected_strategies
+        n = len(strategies)
+        category_codes = self._category_codes
+        
+        risk = np.fromiter((s.risk_reduction_pct for s in strategies), dtype=np.float64, count=n)
+        cost = np.fromiter((s.cost_estimate for s in strategies), dtype=np.float64, count=n)
+        cat = np.fromiter(
+            (category_codes.get(s.category, -1) for s in strategies),
+            dtype=np.int64, count=n
+        )
+        
+        second, third, _, _, tco = _compute_tco(risk, cost, cat, self._rule_table)
+        
+        total_direct = float(cost.sum())
+        total_hidden = float(second.sum() + third.sum())
+        total_tco = float(tco.sum())
+        
+        return {
+            "portfolio_size": n,
+            "original_reported_cost": result.total_cost,
+            "total_direct_cost": total_direct,
+            "total_hidden_costs": total_hidden,
+            "total_cost_of_ownership": total_tco,
+            "cost_multiplier": total_tco / total_direct if total_direct > 0 else 1,
+            "risk_reduction": result.total_risk_reduction,
+            "strategy_analyses": (
+                [self.analyze_strategy(s) for s in strategies] if include_analyses else []
+            ),
+            "summary": f"Portfolio costs ${total_direct:,.0f} on paper but TRUE total cost is ${total_tco:,.0f} when including ripple effects (${total_hidden:,.0f} hidden costs)."
+        }
+    
     def generate_impact_tree(
         self,
         strategy: Strategy
@@ -404,30 +759,30 @@ class CascadingImpactAnalyzer:
             "",
             "FIRST-ORDER EFFECTS (Direct):",
             f"├─ Risk reduction: -{strategy.risk_reduction_pct}%",
-            f"├─ Direct cost: ${strategy.cost_estimate:,.0f}",
+            f"├─ Direct cost: {fmt_money(strategy.cost_estimate)}",
             f"└─ Timeline: {strategy.time_estimate} days",
         ]
         
-        second_order = [e for e in analysis.effects if e.order == ImpactOrder.SECOND]
+        second_order = analysis.second_order_effects
         if second_order:
             lines.append("")
             lines.append("SECOND-ORDER EFFECTS (Ripple):")
+            last = len(second_order) - 1
             for i, effect in enumerate(second_order):
-                prefix = "└─" if i == len(second_order) - 1 else "├─"
-                lines.append(f"{prefix} {effect.description}")
-                lines.append(f"   └─ Impact: ${effect.value:,.0f}")
+                prefix = "└─" if i == last else "├─"
+                lines.append(f"{prefix} {effect.description}\n   └─ Impact: {effect.value_str}")
         
-        third_order = [e for e in analysis.effects if e.order == ImpactOrder.THIRD]
+        third_order = analysis.third_order_effects
         if third_order:
             lines.append("")
             lines.append("THIRD-ORDER EFFECTS (Systemic):")
+            last = len(third_order) - 1
             for i, effect in enumerate(third_order):
-                prefix = "└─" if i == len(third_order) - 1 else "├─"
-                lines.append(f"{prefix} {effect.description}")
-                lines.append(f"   └─ Impact: ${effect.value:,.0f}")
+                prefix = "└─" if i == last else "├─"
+                lines.append(f"{prefix} {effect.description}\n   └─ Impact: {effect.value_str}")
         
         lines.append("")
-        lines.append(f"TOTAL COST OF OWNERSHIP: ${analysis.total_cost_of_ownership:,.0f}")
+        lines.append(f"TOTAL COST OF OWNERSHIP: {fmt_money(analysis.total_cost_of_ownership)}")
         lines.append(f"({analysis.cost_multiplier:.1f}x the direct cost)")
         lines.append("")
         lines.append(f"VERDICT: {'✅ STILL RECOMMENDED' if analysis.still_recommended else '❌ RECONSIDER'}")
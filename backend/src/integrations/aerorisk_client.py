@@ -8,10 +8,17 @@ to make context-aware recommendations.
 """
 
 import os
+import time
+import atexit
+import random
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import httpx
+import orjson
+from cachetools import TTLCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,6 +26,13 @@ logger = logging.getLogger(__name__)
 # AeroRisk API URL - use environment variable or default
 AERORISK_API_URL = os.getenv("AERORISK_API_URL", "https://aerorisk-1.onrender.com")
 
+# Request bodies are encoded with orjson and sent as raw content
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Severity bands: score >= threshold[i] moves up to label[i + 1]
+_SEVERITY_THRESHOLDS = (25.0, 50.0, 75.0)
+_SEVERITY_LABELS = ("low", "medium", "high", "critical")
+
 
 @dataclass
 class RiskPrediction:
@@ -51,27 +65,129 @@ class AeroRiskClient:
     
     def __init__(self, base_url: str = None):
         self.base_url = base_url or AERORISK_API_URL
-        self.timeout = 30.0  # seconds
+        # Fail fast on a slow or cold AeroRisk so callers can degrade gracefully
+        self.timeout = httpx.Timeout(connect=2.0, read=5.0, write=2.0, pool=1.0)
+        self.max_attempts = 3  # predict retries on network errors / 5xx
+        self.limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        
+        # Shared connection pool, created lazily on the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Batch prediction: concurrency cap for the fallback path, and whether
+        # the server has a batch endpoint (None = not probed yet)
+        self.max_concurrent_requests = 16
+        self._batch_supported: Optional[bool] = None
+        
+        # Short-lived response caches for idempotent GETs. Concurrent misses
+        # are coalesced so a burst of callers triggers one upstream request:
+        # health waits on a lock, analytics shares one in-flight task per key
+        # so unrelated keys are fetched in parallel.
+        self.health_ttl = 5.0  # seconds
+        self._health_cache: Optional[Tuple[AeroRiskHealth, float]] = None  # (value, expires_at)
+        self._analytics_cache: TTLCache = TTLCache(maxsize=128, ttl=60)
+        self._health_lock: Optional[asyncio.Lock] = None
+        self._analytics_inflight: Dict[Tuple, asyncio.Task] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the pooled HTTP client.
+        
+        Connections are bound to the event loop they were opened on, so the
+        client is rebuilt when called from a different loop (e.g. successive
+        asyncio.run() calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=True,
+                limits=self.limits
+            )
+            self._client_loop = loop
+            
+            # Locks and in-flight tasks belong to a loop as well
+            self._health_lock = asyncio.Lock()
+            self._analytics_inflight = {}
+        return self._client
+    
+    async def _post_json(self, path: str, payload) -> httpx.Response:
+        """POST a JSON body encoded with orjson over the pooled client."""
+        return await self._get_client().post(
+            path,
+            content=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            headers=_JSON_HEADERS
+        )
+    
+    async def _post_json_with_retry(self, path: str, payload) -> httpx.Response:
+        """
+        POST with bounded retries and jittered exponential backoff.
+        
+        Retries on network errors and 5xx responses. The last 5xx response is
+        returned as-is; the last network error is re-raised.
+        """
+        for attempt in range(self.max_attempts):
+            try:
+                response = await self._post_json(path, payload)
+                if response.status_code < 500 or attempt == self.max_attempts - 1:
+                    return response
+            except httpx.TransportError:
+                if attempt == self.max_attempts - 1:
+                    raise
+            await asyncio.sleep(0.1 * (2 ** attempt) + random.random() * 0.05)
+    
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
         
+    def _cached_health(self) -> Optional[AeroRiskHealth]:
+        """Cached health status if it has not expired yet."""
+        cached = self._health_cache
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        return None
+    
     async def check_health(self) -> AeroRiskHealth:
-        """Check if AeroRisk API is available."""
+        """
+        Check if AeroRisk API is available.
+        
+        The result is cached for `health_ttl` seconds.
+        """
+        health = self._cached_health()
+        if health is not None:
+            return health
+        
+        client = self._get_client()
+        async with self._health_lock:
+            # Another caller may have refreshed it while we waited
+            health = self._cached_health()
+            if health is None:
+                health = await self._fetch_health(client)
+                self._health_cache = (health, time.monotonic() + self.health_ttl)
+            return health
+    
+    async def _fetch_health(self, client: httpx.AsyncClient) -> AeroRiskHealth:
+        """Query the AeroRisk health endpoint."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/health")
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return AeroRiskHealth(
-                        status=data.get("status", "unknown"),
-                        api_available=True,
-                        models_loaded=data.get("models_loaded", False)
-                    )
-                else:
-                    return AeroRiskHealth(
-                        status="error",
-                        api_available=False,
-                        models_loaded=False
-                    )
+            response = await client.get("/health")
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return AeroRiskHealth(
+                    status=data.get("status", "unknown"),
+                    api_available=True,
+                    models_loaded=data.get("models_loaded", False)
+                )
+            else:
+                return AeroRiskHealth(
+                    status="error",
+                    api_available=False,
+                    models_loaded=False
+                )
         except Exception as e:
             logger.error(f"AeroRisk health check failed: {e}")
             return AeroRiskHealth(
@@ -80,6 +196,50 @@ class AeroRiskClient:
                 models_loaded=False
             )
     
+    @staticmethod
+    def _build_predict_payload(
+        origin: str = "ORD",
+        destination: str = "LAX",
+        aircraft_type: str = "B737",
+        month: int = 1,
+        day_of_week: int = 1,
+        scheduled_dep_time: float = 10.0,
+        dep_delay: float = 0.0,
+        distance: float = 1000.0,
+        air_time: float = 120.0,
+        **kwargs
+    ) -> Dict:
+        """Build an AeroRisk predict payload from flight fields."""
+        payload = {
+            "Origin": origin,
+            "Dest": destination,
+            "AircraftType": aircraft_type,
+            "Month": month,
+            "DayOfWeek": day_of_week,
+            "CRSDepTime": scheduled_dep_time,
+            "DepDelay": dep_delay,
+            "Distance": distance,
+            "AirTime": air_time,
+        }
+        
+        # Add any extra fields
+        payload.update(kwargs)
+        return payload
+    
+    @staticmethod
+    def _parse_prediction(data: Dict) -> RiskPrediction:
+        """Convert an AeroRisk prediction response into a RiskPrediction."""
+        # Extract risk score from prediction
+        risk_score = data.get("ensemble_risk_score", 50.0)
+        
+        return RiskPrediction(
+            risk_score=risk_score,
+            severity=_SEVERITY_LABELS[bisect_right(_SEVERITY_THRESHOLDS, risk_score)],
+            confidence=data.get("confidence", 0.8),
+            risk_factors=data.get("risk_factors", []),
+            recommendations=data.get("recommendations", [])
+        )
+    
     async def get_risk_score(
         self,
         origin: str = "ORD",
@@ -99,57 +259,74 @@ class AeroRiskClient:
         Returns None if API is unavailable.
         """
         try:
-            payload = {
-                "Origin": origin,
-                "Dest": destination,
-                "AircraftType": aircraft_type,
-                "Month": month,
-                "DayOfWeek": day_of_week,
-                "CRSDepTime": scheduled_dep_time,
-                "DepDelay": dep_delay,
-                "Distance": distance,
-                "AirTime": air_time,
-            }
+            payload = self._build_predict_payload(
+                origin, destination, aircraft_type, month, day_of_week,
+                scheduled_dep_time, dep_delay, distance, air_time, **kwargs
+            )
             
-            # Add any extra fields
-            payload.update(kwargs)
+            response = await self._post_json_with_retry("/api/v1/predict", payload)
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/predict",
-                    json=payload
-                )
+            if response.status_code == 200:
+                return self._parse_prediction(orjson.loads(response.content))
+            else:
+                logger.error(f"AeroRisk prediction failed: {response.status_code}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"AeroRisk prediction error: {e}")
+            return None
+    
+    async def get_risk_scores_batch(
+        self,
+        flights: List[Dict]
+    ) -> List[Optional[RiskPrediction]]:
+        """
+        Get risk predictions for many flights at once.
+        
+        Each flight dict takes the same fields as get_risk_score. Uses the
+        batch endpoint in a single request when the server has one; servers
+        without it (404/405) get concurrent single predictions over the
+        shared pool instead. Entries are None where a prediction could not be
+        obtained; a failing batch request is not retried per flight.
+        """
+        if not flights:
+            return []
+        
+        payloads = [self._build_predict_payload(**flight) for flight in flights]
+        
+        if self._batch_supported is not False:
+            try:
+                response = await self._post_json("/api/v1/predict/batch", {"flights": payloads})
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Extract risk score from prediction
-                    risk_score = data.get("ensemble_risk_score", 50.0)
-                    
-                    # Determine severity
-                    if risk_score >= 75:
-                        severity = "critical"
-                    elif risk_score >= 50:
-                        severity = "high"
-                    elif risk_score >= 25:
-                        severity = "medium"
-                    else:
-                        severity = "low"
-                    
-                    return RiskPrediction(
-                        risk_score=risk_score,
-                        severity=severity,
-                        confidence=data.get("confidence", 0.8),
-                        risk_factors=data.get("risk_factors", []),
-                        recommendations=data.get("recommendations", [])
+                    self._batch_supported = True
+                    data = orjson.loads(response.content)
+                    predictions = data.get("predictions", []) if isinstance(data, dict) else data
+                    if len(predictions) == len(payloads):
+                        return [self._parse_prediction(p) if p else None for p in predictions]
+                    logger.error(
+                        f"AeroRisk batch returned {len(predictions)} predictions for {len(payloads)} flights"
                     )
+                    return [None] * len(flights)
+                elif response.status_code in (404, 405):
+                    # No batch endpoint on this server; don't probe again
+                    self._batch_supported = False
                 else:
-                    logger.error(f"AeroRisk prediction failed: {response.status_code}")
-                    return None
+                    logger.error(f"AeroRisk batch prediction failed: {response.status_code}")
+                    return [None] * len(flights)
                     
-        except Exception as e:
-            logger.error(f"AeroRisk prediction error: {e}")
-            return None
+            except Exception as e:
+                logger.error(f"AeroRisk batch prediction error: {e}")
+                return [None] * len(flights)
+        
+        # No batch endpoint: concurrent single predictions, capped to avoid flooding the API
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def predict_one(flight: Dict) -> Optional[RiskPrediction]:
+            async with semaphore:
+                return await self.get_risk_score(**flight)
+        
+        return list(await asyncio.gather(*(predict_one(f) for f in flights)))
     
     async def get_recommendations(
         self,
@@ -165,17 +342,13 @@ class AeroRiskClient:
                 "context": context or {}
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/recommend",
-                    json=payload
-                )
+            response = await self._post_json("/api/v1/recommend", payload)
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content).get("recommendations", [])
+            else:
+                return []
                 
-                if response.status_code == 200:
-                    return response.json().get("recommendations", [])
-                else:
-                    return []
-                    
         except Exception as e:
             logger.error(f"AeroRisk recommendations error: {e}")
             return []
@@ -188,7 +361,47 @@ class AeroRiskClient:
     ) -> Dict:
         """
         Get analytics data from AeroRisk.
+        
+        Successful responses are cached for 60 seconds per
+        (start_date, end_date, category); treat the returned dict as read-only.
         """
+        key = (start_date, end_date, category)
+        cached = self._analytics_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        client = self._get_client()
+        
+        # Join the in-flight fetch for this key, or start one
+        task = self._analytics_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_analytics(client, key))
+            self._analytics_inflight[key] = task
+            
+            def _forget(done: asyncio.Task, inflight=self._analytics_inflight) -> None:
+                if inflight.get(key) is done:
+                    del inflight[key]
+            
+            task.add_done_callback(_forget)
+        
+        # Shielded so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+    
+    async def _load_analytics(self, client: httpx.AsyncClient, key: Tuple) -> Dict:
+        """Fetch analytics for a cache key and cache successful responses."""
+        analytics = await self._fetch_analytics(client, *key)
+        if "error" not in analytics:
+            self._analytics_cache[key] = analytics
+        return analytics
+    
+    async def _fetch_analytics(
+        self,
+        client: httpx.AsyncClient,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        category: Optional[str]
+    ) -> Dict:
+        """Query the AeroRisk analytics endpoint."""
         try:
             params = {}
             if start_date:
@@ -198,17 +411,13 @@ class AeroRiskClient:
             if category:
                 params["category"] = category
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/v1/analytics",
-                    params=params
-                )
+            response = await client.get("/api/v1/analytics", params=params)
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                return {"error": "Failed to fetch analytics"}
                 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": "Failed to fetch analytics"}
-                    
         except Exception as e:
             logger.error(f"AeroRisk analytics error: {e}")
             return {"error": str(e)}
@@ -218,13 +427,19 @@ class AeroRiskClient:
 aerorisk_client = AeroRiskClient()
 
 
+@atexit.register
+def _close_default_client() -> None:
+    """Best-effort close of the singleton's pool if its event loop is still usable."""
+    loop = aerorisk_client._client_loop
+    if loop is not None and not loop.is_closed() and not loop.is_running():
+        loop.run_until_complete(aerorisk_client.aclose())
+
+
 # ============================================
 # EXAMPLE USAGE
 # ============================================
 
 if __name__ == "__main__":
-    import asyncio
-    
     async def test_client():
         client = AeroRiskClient()
         
@@ -15,8 +15,14 @@ Date: January 2026
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Mapping, Optional
+from types import MappingProxyType
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import atexit
+import os
+import numpy as np
 import logging
 
 from src.core.optimizer import Strategy, OptimizationResult, CoreOptimizer, StrategyCategory
@@ -34,7 +40,7 @@ logger = logging.getLogger(__name__)
 # DATA MODELS
 # ============================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StakeholderBrief:
     """Tailored brief for a specific stakeholder."""
     stakeholder_role: str
@@ -45,7 +51,7 @@ class StakeholderBrief:
     framing: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DecisionScenario:
     """A decision scenario for comparison."""
     scenario_id: str
@@ -60,7 +66,7 @@ class DecisionScenario:
     rationale: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutiveDecisionPackage:
     """Complete decision package for executives."""
     # Summary
@@ -82,11 +88,90 @@ class ExecutiveDecisionPackage:
     scenarios: List[DecisionScenario] = field(default_factory=list)
     
     # Stakeholder briefs
-    stakeholder_briefs: Dict[str, StakeholderBrief] = field(default_factory=dict)
+    stakeholder_briefs: Optional[Dict[str, StakeholderBrief]] = None
     
     # Decision required
     decision_deadline: str = ""
     decision_owner: str = ""
+    
+    def briefs(self) -> Dict[str, StakeholderBrief]:
+        """Stakeholder briefs keyed by role (empty if none were generated)."""
+        return self.stakeholder_briefs or {}
+
+
+# ============================================
+# DECISION SCENARIOS
+# ============================================
+
+# Scenario order: Do Nothing, Quick Fix, Recommended, Aggressive, Conservative.
+# Costs scale the optimal portfolio cost, except Quick Fix which spends a share
+# of the available budget.
+_SCEN_COST_MUL = np.array([0.0, 0.3, 1.0, 1.3, 0.7])
+_SCEN_COST_OF_BUDGET = np.array([False, True, False, False, False])
+_SCEN_RISK_MUL = np.array([0.0, 0.4, 1.0, 1.2, 0.8])
+
+# Caps: the Aggressive scenario is limited to the budget and a 75% reduction
+_SCEN_COST_CAPPED = np.array([False, False, False, True, False])
+_SCEN_RISK_CAP = np.array([np.inf, np.inf, np.inf, 75.0, np.inf])
+
+# Static DecisionScenario fields per scenario; cost, risk_reduction and
+# confidence are filled in per call (confidence from _SCEN_CONFIDENCE)
+_SCENARIO_TEMPLATES = (
+    MappingProxyType({
+        "scenario_id": "S0", "name": "Do Nothing", "description": "Maintain current state",
+        "timeline_days": 0, "disruption_level": "None", "recommended": False,
+        "rationale": "Risk continues to grow 10-15% annually",
+    }),
+    MappingProxyType({
+        "scenario_id": "S1", "name": "Quick Fix", "description": "Address immediate concerns only",
+        "timeline_days": 30, "disruption_level": "Low", "recommended": False,
+        "rationale": "Temporary relief, doesn't address root causes",
+    }),
+    MappingProxyType({
+        "scenario_id": "S2", "name": "Recommended", "description": "Balanced multi-horizon approach",
+        "timeline_days": 90, "disruption_level": "Medium", "recommended": True,
+        "rationale": "Optimal balance of cost, effectiveness, and sustainability",
+    }),
+    MappingProxyType({
+        "scenario_id": "S3", "name": "Aggressive", "description": "Maximum risk reduction, higher cost",
+        "timeline_days": 60, "disruption_level": "High", "recommended": False,
+        "rationale": "Faster but higher disruption risk",
+    }),
+    MappingProxyType({
+        "scenario_id": "S4", "name": "Conservative", "description": "Lower investment, longer timeline",
+        "timeline_days": 150, "disruption_level": "Low", "recommended": False,
+        "rationale": "Safer approach, acceptable for lower risk situations",
+    }),
+)
+
+# Fixed confidence per scenario; None = taken from the robustness score
+_SCEN_CONFIDENCE = (1.0, 0.95, None, 0.75, 0.92)
+
+
+# Invariant box-drawing frame of the scenario comparison matrix
+_MATRIX_HEADER = (
+    "DECISION SCENARIO COMPARISON",
+    "",
+    "┌──────────────┬──────────┬───────────┬──────────┬────────────┬──────────┐",
+    "│ Scenario     │ Cost     │ Risk Red. │ Timeline │ Disruption │ Conf.    │",
+    "├──────────────┼──────────┼───────────┼──────────┼────────────┼──────────┤",
+)
+_MATRIX_FOOTER = "└──────────────┴──────────┴───────────┴──────────┴────────────┴──────────┘"
+
+
+# ============================================
+# WORKER POOL
+# ============================================
+
+@lru_cache(maxsize=1)
+def _get_pool() -> ThreadPoolExecutor:
+    """Worker pool shared by all ExecutiveDecisionInterface instances."""
+    pool = ThreadPoolExecutor(
+        max_workers=max(2, min(8, os.cpu_count() or 1)),
+        thread_name_prefix="decision-package"
+    )
+    atexit.register(pool.shutdown, wait=False)
+    return pool
 
 
 # ============================================
@@ -99,6 +184,52 @@ class ExecutiveDecisionInterface:
     executive-ready decision packages.
     """
     
+    __slots__ = (
+        "strategies",
+        "budget",
+        "risk_score",
+        "core_optimizer",
+        "impact_analyzer",
+        "purple_team",
+        "horizon_optimizer",
+        "context_engine",
+        "stakeholder_profiles",
+    )
+    
+    # Stakeholder communication profiles (shared, read-only)
+    _STAKEHOLDER_PROFILES: Mapping[str, Mapping] = MappingProxyType({
+        "CEO": MappingProxyType({
+            "primary_concerns": ("Financial impact", "Reputation", "Regulatory compliance"),
+            "decision_criteria": ("ROI", "Optics", "Risk exposure"),
+            "preferred_format": "executive_summary",
+            "framing": "Cost avoidance, risk transfer, reputation protection"
+        }),
+        "CFO": MappingProxyType({
+            "primary_concerns": ("Budget impact", "Cash flow", "Audit trail"),
+            "decision_criteria": ("NPV", "Payback period", "Budget fit"),
+            "preferred_format": "detailed_financials",
+            "framing": "Capital efficiency, risk-adjusted returns"
+        }),
+        "COO": MappingProxyType({
+            "primary_concerns": ("Operational disruption", "Schedule impact"),
+            "decision_criteria": ("Minimal downtime", "Phased approach"),
+            "preferred_format": "operational_plan",
+            "framing": "Minimal disruption, flexible scheduling"
+        }),
+        "VP_SAFETY": MappingProxyType({
+            "primary_concerns": ("Risk reduction", "Compliance", "Safety culture"),
+            "decision_criteria": ("Risk metrics", "SMS alignment"),
+            "preferred_format": "detailed",
+            "framing": "Safety first, measurable improvement"
+        }),
+        "UNION": MappingProxyType({
+            "primary_concerns": ("Job security", "Workload", "Worker safety"),
+            "decision_criteria": ("No layoffs", "Fair workload"),
+            "preferred_format": "clear_simple",
+            "framing": "Worker safety first, collaborative approach"
+        })
+    })
+    
     def __init__(
         self,
         strategies: List[Strategy],
@@ -117,67 +248,49 @@ class ExecutiveDecisionInterface:
         self.context_engine = ContextIntelligenceEngine()
         
         # Stakeholder profiles
-        self.stakeholder_profiles = self._load_stakeholder_profiles()
-    
-    def _load_stakeholder_profiles(self) -> Dict[str, Dict]:
-        """Load stakeholder communication profiles."""
-        return {
-            "CEO": {
-                "primary_concerns": ["Financial impact", "Reputation", "Regulatory compliance"],
-                "decision_criteria": ["ROI", "Optics", "Risk exposure"],
-                "preferred_format": "executive_summary",
-                "framing": "Cost avoidance, risk transfer, reputation protection"
-            },
-            "CFO": {
-                "primary_concerns": ["Budget impact", "Cash flow", "Audit trail"],
-                "decision_criteria": ["NPV", "Payback period", "Budget fit"],
-                "preferred_format": "detailed_financials",
-                "framing": "Capital efficiency, risk-adjusted returns"
-            },
-            "COO": {
-                "primary_concerns": ["Operational disruption", "Schedule impact"],
-                "decision_criteria": ["Minimal downtime", "Phased approach"],
-                "preferred_format": "operational_plan",
-                "framing": "Minimal disruption, flexible scheduling"
-            },
-            "VP_SAFETY": {
-                "primary_concerns": ["Risk reduction", "Compliance", "Safety culture"],
-                "decision_criteria": ["Risk metrics", "SMS alignment"],
-                "preferred_format": "detailed",
-                "framing": "Safety first, measurable improvement"
-            },
-            "UNION": {
-                "primary_concerns": ["Job security", "Workload", "Worker safety"],
-                "decision_criteria": ["No layoffs", "Fair workload"],
-                "preferred_format": "clear_simple",
-                "framing": "Worker safety first, collaborative approach"
-            }
-        }
+        self.stakeholder_profiles = self._STAKEHOLDER_PROFILES
     
     def generate_decision_package(
         self,
         context_indicators: Dict = None
     ) -> ExecutiveDecisionPackage:
-        """
-        Generate complete executive decision package.
-        """
+        """Generate complete executive decision package."""
+        budget, risk_score = self.budget, self.risk_score
+        context_engine = self.context_engine
+        horizon_optimizer = self.horizon_optimizer
+        core_optimizer = self.core_optimizer
+        impact_analyzer = self.impact_analyzer
+        purple_team = self.purple_team
+        
         # 1. Detect context
-        context = self.context_engine.detect_context(context_indicators or {})
+        context = context_engine.detect_context(context_indicators or {})
+        
+        # Steps 2-5 overlap on the shared worker pool: the portfolio solve runs
+        # in the CBC subprocess, and TCO / robustness only depend on its result.
+        # The Pareto solves go to the same pool rather than a nested one; this
+        # thread is never a pool worker, so waiting on them cannot deadlock.
+        # Each engine runs in exactly one task per call, and the engines guard
+        # their memo caches with locks for concurrent calls on one interface.
+        pool = _get_pool()
         
-        # 2. Multi-horizon optimization
-        horizon_plan = self.horizon_optimizer.optimize_all_horizons()
+        # 2. Multi-horizon optimization (independent of the core portfolio)
+        horizon_future = pool.submit(horizon_optimizer.optimize_all_horizons)
         
         # 3. Get optimal portfolio for TCO and robustness analysis
-        optimal = self.core_optimizer.get_optimal_portfolio(
-            budget_limit=self.budget,
-            risk_tolerance="balanced"
+        optimal = core_optimizer.get_optimal_portfolio(
+            budget_limit=budget,
+            risk_tolerance="balanced",
+            executor=pool
         )
         
         # 4. Total cost analysis
-        tco = self.impact_analyzer.analyze_portfolio(optimal)
+        tco_future = pool.submit(impact_analyzer.analyze_portfolio, optimal)
         
         # 5. Robustness assessment
-        robustness = self.purple_team.assess_robustness(optimal, self.budget)
+        robustness = purple_team.assess_robustness(optimal, budget)
+        
+        horizon_plan = horizon_future.result()
+        tco = tco_future.result()
         
         # 6. Generate scenarios
         scenarios = self._generate_scenarios(optimal, robustness)
@@ -186,12 +299,12 @@ class ExecutiveDecisionInterface:
         briefs = self._generate_stakeholder_briefs(horizon_plan, tco, robustness)
         
         # 8. Determine urgency
-        deadline = "Decision required: TODAY" if self.risk_score >= 75 else "Decision required: This week"
+        deadline = "Decision required: TODAY" if risk_score >= 75 else "Decision required: This week"
         
         return ExecutiveDecisionPackage(
-            title=f"Safety Decision Brief - Risk Score {self.risk_score:.0f}",
+            title=f"Safety Decision Brief - Risk Score {risk_score:.0f}",
             situation_summary=self._generate_situation_summary(),
-            risk_score=self.risk_score,
+            risk_score=risk_score,
             horizon_plan=horizon_plan,
             tco_analysis=tco,
             robustness=robustness,
@@ -224,79 +337,22 @@ class ExecutiveDecisionInterface:
         robustness: RobustnessAssessment
     ) -> List[DecisionScenario]:
         """Generate decision scenarios for comparison."""
-        scenarios = []
+        # Scenario costs and risk reductions in one vectorized pass
+        cost_basis = np.where(_SCEN_COST_OF_BUDGET, self.budget, optimal.total_cost)
+        cost_cap = np.where(_SCEN_COST_CAPPED, self.budget, np.inf)
+        costs = np.minimum(_SCEN_COST_MUL * cost_basis, cost_cap).tolist()
+        risks = np.minimum(_SCEN_RISK_MUL * optimal.total_risk_reduction, _SCEN_RISK_CAP).tolist()
         
-        # Scenario 1: Do Nothing
-        scenarios.append(DecisionScenario(
-            scenario_id="S0",
-            name="Do Nothing",
-            description="Maintain current state",
-            cost=0,
-            risk_reduction=0,
-            timeline_days=0,
-            disruption_level="None",
-            confidence=1.0,
-            recommended=False,
-            rationale="Risk continues to grow 10-15% annually"
-        ))
-        
-        # Scenario 2: Quick Fix (Immediate only)
-        quick_fix_cost = self.budget * 0.3
-        scenarios.append(DecisionScenario(
-            scenario_id="S1",
-            name="Quick Fix",
-            description="Address immediate concerns only",
-            cost=quick_fix_cost,
-            risk_reduction=optimal.total_risk_reduction * 0.4,
-            timeline_days=30,
-            disruption_level="Low",
-            confidence=0.95,
-            recommended=False,
-            rationale="Temporary relief, doesn't address root causes"
-        ))
-        
-        # Scenario 3: Recommended (Balanced)
-        scenarios.append(DecisionScenario(
-            scenario_id="S2",
-            name="Recommended",
-            description="Balanced multi-horizon approach",
-            cost=optimal.total_cost,
-            risk_reduction=optimal.total_risk_reduction,
-            timeline_days=90,
-            disruption_level="Medium",
-            confidence=robustness.robustness_score / 100,
-            recommended=True,
-            rationale="Optimal balance of cost, effectiveness, and sustainability"
-        ))
-        
-        # Scenario 4: Aggressive
-        aggressive_cost = min(self.budget, optimal.total_cost * 1.3)
-        scenarios.append(DecisionScenario(
-            scenario_id="S3",
-            name="Aggressive",
-            description="Maximum risk reduction, higher cost",
-            cost=aggressive_cost,
-            risk_reduction=min(optimal.total_risk_reduction * 1.2, 75),
-            timeline_days=60,
-            disruption_level="High",
-            confidence=0.75,
-            recommended=False,
-            rationale="Faster but higher disruption risk"
-        ))
-        
-        # Scenario 5: Conservative
-        scenarios.append(DecisionScenario(
-            scenario_id="S4",
-            name="Conservative",
-            description="Lower investment, longer timeline",
-            cost=optimal.total_cost * 0.7,
-            risk_reduction=optimal.total_risk_reduction * 0.8,
-            timeline_days=150,
-            disruption_level="Low",
-            confidence=0.92,
-            recommended=False,
-            rationale="Safer approach, acceptable for lower risk situations"
-        ))
+        robust_confidence = robustness.robustness_score / 100
+        
+        scenarios = []
+        for template, cost, risk, confidence in zip(_SCENARIO_TEMPLATES, costs, risks, _SCEN_CONFIDENCE):
+            scenarios.append(DecisionScenario(
+                **template,
+                cost=cost,
+                risk_reduction=risk,
+                confidence=robust_confidence if confidence is None else confidence
+            ))
         
         return scenarios
     
@@ -309,44 +365,54 @@ class ExecutiveDecisionInterface:
         """Generate tailored briefs for each stakeholder."""
         briefs = {}
         
-        # CEO Brief
-        avoided_cost = horizon_plan.total_risk_reduction * 100000  # $100K per 1%
-        roi = avoided_cost / horizon_plan.total_cost if horizon_plan.total_cost > 0 else 0
+        # Derived figures shared by the CEO and CFO briefs, computed once
+        total_cost = horizon_plan.total_cost
+        total_reduction = horizon_plan.total_risk_reduction
+        avoided_cost = total_reduction * 100000  # $100K per 1%
+        roi = avoided_cost / total_cost if total_cost > 0 else 0
+        payback_months = total_cost / (avoided_cost / 12) if avoided_cost > 0 else 0
         
+        investment = f"${total_cost:,.0f}"
+        reduction = f"{total_reduction:.0f}%"
+        roi_str = f"{roi:.1f}x"
+        payback = f"{payback_months:.1f} months"
+        
+        # CEO Brief
         briefs["CEO"] = StakeholderBrief(
             stakeholder_role="CEO",
-            subject_line=f"Safety Investment Decision - ${horizon_plan.total_cost:,.0f} for {horizon_plan.total_risk_reduction:.0f}% Risk Reduction",
+            subject_line=f"Safety Investment Decision - {investment} for {reduction} Risk Reduction",
             key_points=[
-                f"Prevents ${avoided_cost:,.0f} in potential incident costs (ROI: {roi:.1f}x)",
+                f"Prevents ${avoided_cost:,.0f} in potential incident costs (ROI: {roi_str})",
                 f"Addresses regulatory compliance requirements",
                 f"Implementation complete in 180 days with minimal disruption",
                 f"Robustness score: {robustness.robustness_score:.0f}% (Grade: {robustness.resilience_rating})"
             ],
             recommended_action="Approve recommended portfolio",
             metrics_highlighted={
-                "ROI": f"{roi:.1f}x",
-                "Risk Reduction": f"{horizon_plan.total_risk_reduction:.0f}%",
-                "Investment": f"${horizon_plan.total_cost:,.0f}"
+                "ROI": roi_str,
+                "Risk Reduction": reduction,
+                "Investment": investment
             },
             framing=self.stakeholder_profiles["CEO"]["framing"]
         )
         
         # CFO Brief
-        payback_months = horizon_plan.total_cost / (avoided_cost / 12) if avoided_cost > 0 else 0
+        tco_total = tco.get("total_cost_of_ownership", 0)
+        tco_multiplier = tco.get("cost_multiplier", 1)
         
         briefs["CFO"] = StakeholderBrief(
             stakeholder_role="CFO",
-            subject_line=f"Safety Capital Request - ${horizon_plan.total_cost:,.0f}",
+            subject_line=f"Safety Capital Request - {investment}",
             key_points=[
-                f"Total investment: ${horizon_plan.total_cost:,.0f}",
+                f"Total investment: {investment}",
                 f"NPV (5-year): ${avoided_cost * 2:,.0f}",
-                f"Payback period: {payback_months:.1f} months",
-                f"True total cost (with ripple effects): ${tco.get('total_cost_of_ownership', 0):,.0f}"
+                f"Payback period: {payback}",
+                f"True total cost (with ripple effects): ${tco_total:,.0f}"
             ],
             recommended_action="Allocate from Q1 contingency fund",
             metrics_highlighted={
-                "Payback": f"{payback_months:.1f} months",
-                "TCO Multiplier": f"{tco.get('cost_multiplier', 1):.1f}x",
+                "Payback": payback,
+                "TCO Multiplier": f"{tco_multiplier:.1f}x",
                 "Budget Fit": "Within discretionary limits"
             },
             framing=self.stakeholder_profiles["CFO"]["framing"]
@@ -375,105 +441,83 @@ class ExecutiveDecisionInterface:
     
     def generate_one_pager(self, package: ExecutiveDecisionPackage) -> str:
         """Generate one-page executive summary."""
-        lines = [
-            "=" * 70,
-            f"📋 {package.title}",
-            "=" * 70,
-            "",
-            "SITUATION:",
-            package.situation_summary,
-            "",
-        ]
+        return "\n".join(self._iter_one_pager(package))
+    
+    def _iter_one_pager(self, package: ExecutiveDecisionPackage) -> Iterator[str]:
+        """Yield the one-page executive summary line by line (for streaming)."""
+        rule = "=" * 70
+        divider = "─" * 70
+        
+        yield from (rule, f"📋 {package.title}", rule, "", "SITUATION:", package.situation_summary, "")
         
         if package.horizon_plan:
             hp = package.horizon_plan
-            lines.extend([
-                "RECOMMENDATION:",
-                f"Implement 3-phase portfolio for {hp.total_risk_reduction:.0f}% risk reduction.",
-                "",
-                "IMMEDIATE ACTIONS (This Week):",
-            ])
-            for item in hp.immediate_plan.action_items[:2]:
-                lines.append(f"  {item}")
-            lines.append(f"  Cost: ${hp.immediate_plan.total_cost:,.0f} | Risk↓: {hp.immediate_plan.risk_reduction:.0f}%")
-            
-            lines.extend([
-                "",
-                "TACTICAL PLAN (This Quarter):",
-            ])
-            for item in hp.tactical_plan.action_items[:2]:
-                lines.append(f"  {item}")
-            lines.append(f"  Cost: ${hp.tactical_plan.total_cost:,.0f} | Risk↓: {hp.tactical_plan.risk_reduction:.0f}%")
+            yield "RECOMMENDATION:"
+            yield f"Implement 3-phase portfolio for {hp.total_risk_reduction:.0f}% risk reduction."
             
-            lines.extend([
-                "",
-                "STRATEGIC INVESTMENT (This Year):",
-            ])
-            for item in hp.strategic_plan.action_items[:2]:
-                lines.append(f"  {item}")
-            lines.append(f"  Cost: ${hp.strategic_plan.total_cost:,.0f} | Risk↓: {hp.strategic_plan.risk_reduction:.0f}%")
+            for heading, plan in (
+                ("IMMEDIATE ACTIONS (This Week):", hp.immediate_plan),
+                ("TACTICAL PLAN (This Quarter):", hp.tactical_plan),
+                ("STRATEGIC INVESTMENT (This Year):", hp.strategic_plan),
+            ):
+                yield from ("", heading)
+                for item in plan.action_items[:2]:
+                    yield f"  {item}"
+                yield f"  Cost: ${plan.total_cost:,.0f} | Risk↓: {plan.risk_reduction:.0f}%"
+        
+        yield from ("", divider, "TRADE-OFFS:")
         
-        lines.extend([
-            "",
-            "─" * 70,
-            "TRADE-OFFS:",
-        ])
-        
-        for scenario in package.scenarios:
-            marker = " ✓" if scenario.recommended else ""
-            lines.append(
-                f"  {scenario.name}: ${scenario.cost:,.0f}, "
-                f"{scenario.risk_reduction:.0f}% reduction, "
-                f"{scenario.timeline_days}d{marker}"
+        for s in package.scenarios:
+            yield (
+                f"  {s.name}: ${s.cost:,.0f}, {s.risk_reduction:.0f}% reduction, "
+                f"{s.timeline_days}d{' ✓' if s.recommended else ''}"
             )
         
         if package.robustness:
-            lines.extend([
+            yield from (
                 "",
                 f"ROBUSTNESS: {package.robustness.robustness_score:.0f}/100 "
                 f"(Grade: {package.robustness.resilience_rating})",
-                f"  Worst case still achieves 70% of intended value",
-            ])
+                "  Worst case still achieves 70% of intended value",
+            )
         
-        lines.extend([
+        yield from (
             "",
-            "─" * 70,
+            divider,
             f"DECISION NEEDED: {package.decision_deadline}",
             f"DECISION OWNER: {package.decision_owner}",
-            "=" * 70,
-        ])
-        
-        return "\n".join(lines)
+            rule,
+        )
     
     def generate_scenario_matrix(self, package: ExecutiveDecisionPackage) -> str:
         """Generate scenario comparison matrix."""
-        lines = [
-            "DECISION SCENARIO COMPARISON",
-            "",
-            "┌──────────────┬──────────┬───────────┬──────────┬────────────┬──────────┐",
-            "│ Scenario     │ Cost     │ Risk Red. │ Timeline │ Disruption │ Conf.    │",
-            "├──────────────┼──────────┼───────────┼──────────┼────────────┼──────────┤",
-        ]
+        return "\n".join(self._iter_scenario_matrix(package))
+    
+    def _iter_scenario_matrix(self, package: ExecutiveDecisionPackage) -> Iterator[str]:
+        """Yield the scenario comparison matrix line by line (for streaming)."""
+        yield from _MATRIX_HEADER
         
         for s in package.scenarios:
-            marker = " ✓" if s.recommended else ""
-            lines.append(
-                f"│ {s.name:<12}{marker} │ ${s.cost/1000:>6.0f}K │ {s.risk_reduction:>8.0f}% │ "
-                f"{s.timeline_days:>6}d │ {s.disruption_level:<10} │ {s.confidence*100:>6.0f}% │"
+            cells = (
+                s.name.ljust(12) + (" ✓" if s.recommended else ""),
+                f"${s.cost/1000:>6.0f}K",
+                f"{s.risk_reduction:>8.0f}%",
+                f"{s.timeline_days:>6}d",
+                s.disruption_level.ljust(10),
+                f"{s.confidence*100:>6.0f}%",
             )
+            yield "│ " + " │ ".join(cells) + " │"
         
-        lines.append("└──────────────┴──────────┴───────────┴──────────┴────────────┴──────────┘")
+        yield _MATRIX_FOOTER
         
         # Add recommendation
         recommended = next((s for s in package.scenarios if s.recommended), None)
         if recommended:
-            lines.extend([
+            yield from (
                 "",
                 f"RECOMMENDED: {recommended.name}",
                 f"Rationale: {recommended.rationale}"
-            ])
-        
-        return "\n".join(lines)
+            )
 
 
 # ============================================
@@ -536,7 +580,7 @@ if __name__ == "__main__":
     print(interface.generate_scenario_matrix(package))
     
     print("\n👤 CEO BRIEF:")
-    ceo_brief = package.stakeholder_briefs.get("CEO")
+    ceo_brief = package.briefs().get("CEO")
     if ceo_brief:
         print(f"Subject: {ceo_brief.subject_line}")
         print("Key Points:")
@@ -1,8 +1,25 @@
 """RiskAdvisor Negotiation Module"""
-from src.negotiation.constraint_engine import (
-    ConstraintNegotiationEngine,
-    NegotiableConstraint,
-    NegotiationOption,
-    NegotiationPackage,
-    ConstraintType
-)
+
+# Re-exports are resolved lazily (PEP 562) so importing the package does not
+# pull in the optimizer stack until a negotiation class is actually used
+__all__ = [
+    "ConstraintNegotiationEngine",
+    "NegotiableConstraint",
+    "ConstraintArray",
+    "NegotiationOption",
+    "NegotiationPackage",
+    "ConstraintType"
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from src.negotiation import constraint_engine
+        value = getattr(constraint_engine, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -13,16 +13,17 @@ Author: Umang Kumar
 Date: January 2026
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 import numpy as np
 from datetime import datetime
 import logging
 
 from src.core.optimizer import Strategy, Constraint, OptimizationResult, CoreOptimizer
+from src.core.jit import njit
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +37,7 @@ class ConstraintType(Enum):
     LEARNED = "learned"  # Discovered from historical patterns
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NegotiableConstraint(Constraint):
     """Extended constraint with negotiation metadata."""
     constraint_type_enum: ConstraintType = ConstraintType.SOFT
@@ -60,9 +61,64 @@ class NegotiableConstraint(Constraint):
             base *= (1 + self.seasonal_adjustment)
         
         return base
+    
+    @classmethod
+    def from_array(cls, arr: "ConstraintArray", i: int) -> "NegotiableConstraint":
+        """Materialize the i-th constraint of a ConstraintArray."""
+        return cls(**{
+            name: column[i].item() if name in arr.NUMERIC_FIELDS else column[i]
+            for name, column in arr.columns.items()
+        })
+
+
+class ConstraintArray:
+    """
+    Structure-of-arrays layout for a collection of NegotiableConstraint.
+    
+    Numeric fields are stored as contiguous float64 arrays for vectorized
+    scoring; the remaining fields are kept as tuples so single constraints
+    can be rebuilt on demand with NegotiableConstraint.from_array.
+    """
+    
+    NUMERIC_FIELDS = frozenset({
+        "max_value", "penalty_per_unit", "relaxation_cost", "max_relaxation",
+        "historical_average", "historical_std", "seasonal_adjustment"
+    })
+    
+    def __init__(self, constraints: List[NegotiableConstraint]):
+        self.columns: Dict[str, object] = {}
+        for f in fields(NegotiableConstraint):
+            values = [getattr(c, f.name) for c in constraints]
+            self.columns[f.name] = (
+                np.array(values, dtype=np.float64) if f.name in self.NUMERIC_FIELDS
+                else tuple(values)
+            )
+        
+        # Hot columns used by the relaxation kernel
+        self.max_values = self.columns["max_value"]
+        self.relaxation_costs = self.columns["relaxation_cost"]
+        self.max_relaxations = self.columns["max_relaxation"]
+        self.seasonal_adjustments = self.columns["seasonal_adjustment"]
+        
+        # Index -> name and name -> index lookups
+        self.names = self.columns["name"]
+        self._index = {name: i for i, name in enumerate(self.names)}
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def index_of(self, name: str) -> Optional[int]:
+        """Position of the named constraint, or None."""
+        return self._index.get(name)
+    
+    def adjusted_values(self, context: Dict = None) -> np.ndarray:
+        """Vectorized get_adjusted_value over all constraints."""
+        if context and context.get("quarter") == "Q4":
+            return self.max_values * (1 + self.seasonal_adjustments)
+        return self.max_values.copy()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NegotiationOption:
     """A single alternative when constraints can't be met."""
     option_id: str
@@ -86,7 +142,7 @@ class NegotiationOption:
     feasibility_score: float = 0.0  # 0-1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NegotiationPackage:
     """Complete package of alternatives when optimal can't be achieved."""
     original_gap: Dict[str, float]  # What's missing
@@ -99,6 +155,108 @@ class NegotiationPackage:
     created_at: datetime = field(default_factory=datetime.now)
 
 
+# ============================================
+# RELAXATION SCORING KERNEL
+# ============================================
+
+@njit(cache=True)
+def _score_relaxations(max_vals, costs, max_rel, seasonal, quarter_is_q4, target):
+    """
+    Score relaxing each constraint so that it admits `target`.
+    
+    Inputs are parallel float64 arrays (one entry per constraint). Returns
+    (feasibility, total_cost): feasibility is 1.0 when the needed relaxation
+    fits within max_relaxation and max_relaxation / needed otherwise;
+    total_cost is relaxation_cost * needed. Runs as plain NumPy/Python when
+    Numba is not installed.
+    """
+    n = max_vals.shape[0]
+    feasibility = np.empty(n)
+    total_cost = np.empty(n)
+    
+    for i in range(n):
+        adjusted = max_vals[i] * (1.0 + seasonal[i]) if quarter_is_q4 else max_vals[i]
+        needed = target - adjusted
+        if needed <= 0.0:
+            feasibility[i] = 1.0
+            total_cost[i] = 0.0
+        else:
+            feasibility[i] = 1.0 if needed <= max_rel[i] else max(max_rel[i], 0.0) / needed
+            total_cost[i] = costs[i] * needed
+    
+    return feasibility, total_cost
+
+
+def _cost_effectiveness(strategies: List[Strategy]) -> Tuple[np.ndarray, np.ndarray]:
+    """Cost and risk-reduction-per-dollar arrays (zero-cost rates 0)."""
+    costs = np.array([s.cost_estimate for s in strategies], dtype=np.float64)
+    reductions = np.array([s.risk_reduction_pct for s in strategies], dtype=np.float64)
+    ratios = np.divide(reductions, costs, out=np.zeros_like(reductions), where=costs > 0)
+    return costs, ratios
+
+
+@njit(cache=True)
+def _quick_wins(costs, ratios, max_budget):
+    """
+    Greedy cost-effectiveness selection under `max_budget`.
+    
+    Positions are taken by descending `ratios` (risk reduction per dollar;
+    ties keep input order). Items that don't fit are skipped and later ones
+    still considered. Returns the chosen positions in selection order. Runs
+    as plain NumPy/Python when Numba is not installed.
+    """
+    n = costs.shape[0]
+    
+    # mergesort is the stable sort in both NumPy and Numba
+    order = np.argsort(-ratios, kind="mergesort")
+    
+    # The longest affordable prefix is taken outright ...
+    cumulative = np.cumsum(costs[order])
+    k = np.searchsorted(cumulative, max_budget, side="right")
+    selected = np.empty(n, dtype=np.int64)
+    selected[:k] = order[:k]
+    count = k
+    total = cumulative[k - 1] if k > 0 else 0.0
+    
+    # ... then the rest is filled greedily, skipping what doesn't fit
+    for j in range(k, n):
+        i = order[j]
+        if total + costs[i] <= max_budget:
+            selected[count] = i
+            count += 1
+            total += costs[i]
+    
+    return selected[:count]
+
+
+# ============================================
+# FEASIBILITY CHECK
+# ============================================
+
+@lru_cache(maxsize=1024, typed=True)
+def _check_feasibility(
+    required_budget: float,
+    required_timeline: int,
+    available_budget: float,
+    available_timeline: int
+) -> Tuple[bool, Tuple[Tuple[str, float], ...]]:
+    """
+    Memoized feasibility check; gaps come back as hashable (name, gap) pairs.
+    
+    typed=True keeps e.g. int and float arguments apart, so the gap values
+    keep the numeric type the caller passed in.
+    """
+    gaps = []
+    
+    if required_budget > available_budget:
+        gaps.append(("budget", required_budget - available_budget))
+    
+    if required_timeline > available_timeline:
+        gaps.append(("timeline", required_timeline - available_timeline))
+    
+    return len(gaps) == 0, tuple(gaps)
+
+
 # ============================================
 # CONSTRAINT NEGOTIATION ENGINE
 # ============================================
@@ -114,6 +272,19 @@ class ConstraintNegotiationEngine:
     4. Creates a negotiation package
     """
     
+    # Max memoized portfolio solves kept per engine (oldest evicted first)
+    PORTFOLIO_CACHE_SIZE = 128
+    
+    # Negotiation options as (builder method, only applies when there is
+    # a budget gap), in the order they are presented
+    _OPTION_SPECS = (
+        ("_phased_option", True),
+        ("_risk_adjusted_option", True),
+        ("_cross_funding_option", True),
+        ("_emergency_funding_option", True),
+        ("_alternative_resourcing_option", False)
+    )
+    
     def __init__(
         self,
         strategies: List[Strategy],
@@ -124,6 +295,59 @@ class ConstraintNegotiationEngine:
         self.constraints = constraints
         self.historical = historical_implementations or []
         
+        # Constraints in structure-of-arrays form for vectorized scoring
+        self.constraint_array = ConstraintArray(constraints)
+        
+        # Name lookup for challenge_constraint; built from the end so the
+        # first constraint wins if names repeat, as with a linear scan
+        self._constraint_by_name = {c.name: c for c in reversed(constraints)}
+        
+        # Catalog costs and cost-effectiveness ratios, aligned with
+        # self.strategies, for the quick-win selector
+        self._pack_strategies()
+        
+        # One optimizer over the strategy catalog, with solved portfolios
+        # memoized per (budget, timeline, risk tolerance)
+        self._optimizer = CoreOptimizer(strategies, []).prepare()
+        self._portfolio_cache: Dict[Tuple[float, int, str], OptimizationResult] = {}
+    
+    def _cached_portfolio(
+        self,
+        budget_limit: float,
+        timeline_limit: int = 365,
+        risk_tolerance: str = "balanced"
+    ) -> OptimizationResult:
+        """
+        Memoized CoreOptimizer.get_optimal_portfolio over self.strategies.
+        
+        Results are shared between callers, so treat them as read-only. Call
+        clear_portfolio_cache() after changing the strategies in place.
+        """
+        key = (budget_limit, timeline_limit, risk_tolerance)
+        result = self._portfolio_cache.get(key)
+        if result is None:
+            result = self._optimizer.get_optimal_portfolio(
+                budget_limit=budget_limit,
+                timeline_limit=timeline_limit,
+                risk_tolerance=risk_tolerance
+            )
+            if len(self._portfolio_cache) >= self.PORTFOLIO_CACHE_SIZE:
+                self._portfolio_cache.pop(next(iter(self._portfolio_cache)))
+            self._portfolio_cache[key] = result
+        return result
+    
+    def clear_portfolio_cache(self) -> None:
+        """Drop memoized portfolios (e.g. after strategies were modified)."""
+        self._portfolio_cache.clear()
+        self._optimizer.prepare()
+        self._pack_strategies()
+    
+    def _pack_strategies(self) -> None:
+        """Build the catalog cost / ratio arrays used by _select_quick_wins."""
+        strategies = self.strategies
+        self._costs, self._ratios = _cost_effectiveness(strategies)
+        self._strategy_index = {s.id: i for i, s in enumerate(strategies)}
+        
     def check_feasibility(
         self,
         required_budget: float,
@@ -135,15 +359,36 @@ class ConstraintNegotiationEngine:
         Check if solution is feasible given constraints.
         Returns (feasible, gaps).
         """
-        gaps = {}
-        
-        if required_budget > available_budget:
-            gaps["budget"] = required_budget - available_budget
+        feasible, gaps = _check_feasibility(
+            required_budget, required_timeline, available_budget, available_timeline
+        )
+        return feasible, dict(gaps)
+    
+    def score_relaxations(
+        self,
+        target: float,
+        context: Dict = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Score how far each constraint must be relaxed to admit `target`.
         
-        if required_timeline > available_timeline:
-            gaps["timeline"] = required_timeline - available_timeline
+        Values are seasonally adjusted like get_adjusted_value. Returns
+        {constraint name: {"feasibility": 0-1, "relaxation_cost": $}}.
+        """
+        arr = self.constraint_array
+        feasibility, total_cost = _score_relaxations(
+            arr.max_values,
+            arr.relaxation_costs,
+            arr.max_relaxations,
+            arr.seasonal_adjustments,
+            bool(context and context.get("quarter") == "Q4"),
+            float(target)
+        )
         
-        return len(gaps) == 0, gaps
+        return {
+            name: {"feasibility": f, "relaxation_cost": cost}
+            for name, f, cost in zip(arr.names, feasibility.tolist(), total_cost.tolist())
+        }
     
     def learn_from_history(self) -> Dict[str, float]:
         """
@@ -154,29 +399,35 @@ class ConstraintNegotiationEngine:
         if not self.historical:
             return learnings
         
-        # Analyze cost overruns
-        cost_ratios = []
-        for impl in self.historical:
+        # One pass fills cost and timeline ratios; masks mark which
+        # implementations reported both predicted and actual values
+        n = len(self.historical)
+        cost_ratios = np.empty(n)
+        time_ratios = np.empty(n)
+        cost_mask = np.zeros(n, dtype=bool)
+        time_mask = np.zeros(n, dtype=bool)
+        
+        for i, impl in enumerate(self.historical):
             if impl.get("predicted_cost") and impl.get("actual_cost"):
-                ratio = impl["actual_cost"] / impl["predicted_cost"]
-                cost_ratios.append(ratio)
+                cost_ratios[i] = impl["actual_cost"] / impl["predicted_cost"]
+                cost_mask[i] = True
+            if impl.get("predicted_days") and impl.get("actual_days"):
+                time_ratios[i] = impl["actual_days"] / impl["predicted_days"]
+                time_mask[i] = True
         
-        if cost_ratios:
-            learnings["cost_adjustment"] = np.mean(cost_ratios)
-            learnings["cost_std"] = np.std(cost_ratios)
-            logger.info(f"Learned: Costs typically {learnings['cost_adjustment']:.0%} of estimates")
+        # Analyze cost overruns
+        if cost_mask.any():
+            ratios = cost_ratios[cost_mask]
+            learnings["cost_adjustment"] = ratios.mean()
+            learnings["cost_std"] = ratios.std()
+            logger.info("Learned: Costs typically %.0f%% of estimates", learnings["cost_adjustment"] * 100)
         
         # Analyze timeline overruns
-        time_ratios = []
-        for impl in self.historical:
-            if impl.get("predicted_days") and impl.get("actual_days"):
-                ratio = impl["actual_days"] / impl["predicted_days"]
-                time_ratios.append(ratio)
-        
-        if time_ratios:
-            learnings["timeline_adjustment"] = np.mean(time_ratios)
-            learnings["timeline_std"] = np.std(time_ratios)
-            logger.info(f"Learned: Timelines typically {learnings['timeline_adjustment']:.0%} of estimates")
+        if time_mask.any():
+            ratios = time_ratios[time_mask]
+            learnings["timeline_adjustment"] = ratios.mean()
+            learnings["timeline_std"] = ratios.std()
+            logger.info("Learned: Timelines typically %.0f%% of estimates", learnings["timeline_adjustment"] * 100)
         
         return learnings
     
@@ -196,6 +447,9 @@ class ConstraintNegotiationEngine:
         3. Cross-functional funding
         4. ROI-based emergency request
         5. Alternative resourcing
+        
+        Options 1-4 close a budget gap; when only the timeline is short,
+        alternative resourcing is the only option built.
         """
         feasible, gaps = self.check_feasibility(
             optimal_result.total_cost,
@@ -212,45 +466,79 @@ class ConstraintNegotiationEngine:
                 recommendation_reason="Original plan is feasible"
             )
         
+        # Options are built from the declarative spec table; builders whose
+        # gap isn't present (e.g. the conservative re-solve of Option 2 on a
+        # timeline-only gap) are never called
+        # The recommendation is tracked as options are built: prefer high
+        # feasibility + high risk reduction (first option wins ties)
+        has_budget_gap = gaps.get("budget", 0) > 0
         options = []
+        best_option = None
+        best_score = float("-inf")
         
-        # OPTION 1: Phased Implementation
-        if gaps.get("budget", 0) > 0:
-            phase1_strategies = self._select_quick_wins(
-                optimal_result.selected_strategies,
-                available_budget * 0.8
-            )
-            
-            phase2_strategies = [
-                s for s in optimal_result.selected_strategies 
-                if s not in phase1_strategies
-            ]
+        for builder, needs_budget_gap in self._OPTION_SPECS:
+            if needs_budget_gap and not has_budget_gap:
+                continue
             
-            phase1_cost = sum(s.cost_estimate for s in phase1_strategies)
-            phase1_reduction = sum(s.risk_reduction_pct for s in phase1_strategies)
+            option = getattr(self, builder)(optimal_result, available_budget, available_timeline, gaps)
+            options.append(option)
             
-            options.append(NegotiationOption(
-                option_id="PHASED_001",
-                title="Phased Implementation",
-                description=f"Phase 1 now (${phase1_cost:,.0f}), Phase 2 next quarter",
-                constraint_relaxations={"budget": available_budget - phase1_cost},
-                cost=phase1_cost,
-                risk_reduction=phase1_reduction,
-                timeline_days=60,
-                requires_approval="manager",
-                business_case="Deliver value NOW, secure Phase 2 funding based on results",
-                feasibility_score=0.9
-            ))
-        
-        # OPTION 2: Risk-Adjusted Portfolio
-        core_optimizer = CoreOptimizer(self.strategies, [])
-        conservative_result = core_optimizer.get_optimal_portfolio(
+            score = option.feasibility_score * (option.risk_reduction / 100)
+            if score > best_score:
+                best_option = option
+                best_score = score
+        
+        return NegotiationPackage(
+            original_gap=gaps,
+            options=options,
+            recommended_option=best_option.option_id,
+            recommendation_reason=f"Best balance of feasibility ({best_option.feasibility_score:.0%}) and effectiveness ({best_option.risk_reduction:.0f}%)"
+        )
+    
+    def _phased_option(
+        self,
+        optimal_result: OptimizationResult,
+        available_budget: float,
+        available_timeline: int,
+        gaps: Dict[str, float]
+    ) -> NegotiationOption:
+        """OPTION 1: Phased Implementation."""
+        phase1_strategies = self._select_quick_wins(
+            optimal_result.selected_strategies,
+            available_budget * 0.8
+        )
+        
+        phase1_cost = sum(s.cost_estimate for s in phase1_strategies)
+        phase1_reduction = sum(s.risk_reduction_pct for s in phase1_strategies)
+        
+        return NegotiationOption(
+            option_id="PHASED_001",
+            title="Phased Implementation",
+            description=f"Phase 1 now (${phase1_cost:,.0f}), Phase 2 next quarter",
+            constraint_relaxations={"budget": available_budget - phase1_cost},
+            cost=phase1_cost,
+            risk_reduction=phase1_reduction,
+            timeline_days=60,
+            requires_approval="manager",
+            business_case="Deliver value NOW, secure Phase 2 funding based on results",
+            feasibility_score=0.9
+        )
+    
+    def _risk_adjusted_option(
+        self,
+        optimal_result: OptimizationResult,
+        available_budget: float,
+        available_timeline: int,
+        gaps: Dict[str, float]
+    ) -> NegotiationOption:
+        """OPTION 2: Risk-Adjusted Portfolio."""
+        conservative_result = self._cached_portfolio(
             budget_limit=available_budget,
             timeline_limit=available_timeline,
             risk_tolerance="conservative"
         )
         
-        options.append(NegotiationOption(
+        return NegotiationOption(
             option_id="RISKADJUST_001",
             title="Risk-Adjusted Portfolio",
             description=f"Reduced scope, {conservative_result.total_risk_reduction:.0f}% risk reduction",
@@ -260,47 +548,66 @@ class ConstraintNegotiationEngine:
             requires_approval="team",
             business_case="Stay within budget, accept lower risk reduction",
             feasibility_score=0.95
-        ))
-        
-        # OPTION 3: Cross-Functional Funding
-        if gaps.get("budget", 0) > 0:
-            budget_gap = gaps["budget"]
-            
-            options.append(NegotiationOption(
-                option_id="CROSSFUND_001",
-                title="Cross-Functional Funding",
-                description="Split costs across Safety, Operations, and Maintenance",
-                constraint_relaxations={"budget": 0},  # No relaxation needed
-                cost=optimal_result.total_cost,
-                risk_reduction=optimal_result.total_risk_reduction,
-                timeline_days=optimal_result.total_timeline_days,
-                requires_approval="director",
-                business_case=f"Safety: ${available_budget:,.0f}, Ops contribution: ${budget_gap * 0.6:,.0f}, Maint: ${budget_gap * 0.4:,.0f}",
-                feasibility_score=0.7
-            ))
-        
-        # OPTION 4: ROI-Based Emergency Request
-        if gaps.get("budget", 0) > 0:
-            budget_gap = gaps["budget"]
-            avoided_incident_cost = optimal_result.total_risk_reduction * 100000  # $100K per 1%
-            roi = avoided_incident_cost / optimal_result.total_cost
-            payback_months = (optimal_result.total_cost / (avoided_incident_cost / 12))
-            
-            options.append(NegotiationOption(
-                option_id="EMERGENCY_001",
-                title="ROI-Based Emergency Funding Request",
-                description=f"Request ${budget_gap:,.0f} additional with {roi:.1f}x ROI",
-                constraint_relaxations={"budget": -budget_gap},  # Increase budget
-                cost=optimal_result.total_cost,
-                risk_reduction=optimal_result.total_risk_reduction,
-                timeline_days=optimal_result.total_timeline_days,
-                requires_approval="vp",
-                business_case=f"ROI: {roi:.1f}x, Payback: {payback_months:.1f} months, Avoids ${avoided_incident_cost:,.0f} in incident costs",
-                feasibility_score=0.6
-            ))
-        
-        # OPTION 5: Alternative Resourcing
-        options.append(NegotiationOption(
+        )
+    
+    def _cross_funding_option(
+        self,
+        optimal_result: OptimizationResult,
+        available_budget: float,
+        available_timeline: int,
+        gaps: Dict[str, float]
+    ) -> NegotiationOption:
+        """OPTION 3: Cross-Functional Funding."""
+        budget_gap = gaps["budget"]
+        
+        return NegotiationOption(
+            option_id="CROSSFUND_001",
+            title="Cross-Functional Funding",
+            description="Split costs across Safety, Operations, and Maintenance",
+            constraint_relaxations={"budget": 0},  # No relaxation needed
+            cost=optimal_result.total_cost,
+            risk_reduction=optimal_result.total_risk_reduction,
+            timeline_days=optimal_result.total_timeline_days,
+            requires_approval="director",
+            business_case=f"Safety: ${available_budget:,.0f}, Ops contribution: ${budget_gap * 0.6:,.0f}, Maint: ${budget_gap * 0.4:,.0f}",
+            feasibility_score=0.7
+        )
+    
+    def _emergency_funding_option(
+        self,
+        optimal_result: OptimizationResult,
+        available_budget: float,
+        available_timeline: int,
+        gaps: Dict[str, float]
+    ) -> NegotiationOption:
+        """OPTION 4: ROI-Based Emergency Request."""
+        budget_gap = gaps["budget"]
+        avoided_incident_cost = optimal_result.total_risk_reduction * 100000  # $100K per 1%
+        roi = avoided_incident_cost / optimal_result.total_cost
+        payback_months = (optimal_result.total_cost / (avoided_incident_cost / 12))
+        
+        return NegotiationOption(
+            option_id="EMERGENCY_001",
+            title="ROI-Based Emergency Funding Request",
+            description=f"Request ${budget_gap:,.0f} additional with {roi:.1f}x ROI",
+            constraint_relaxations={"budget": -budget_gap},  # Increase budget
+            cost=optimal_result.total_cost,
+            risk_reduction=optimal_result.total_risk_reduction,
+            timeline_days=optimal_result.total_timeline_days,
+            requires_approval="vp",
+            business_case=f"ROI: {roi:.1f}x, Payback: {payback_months:.1f} months, Avoids ${avoided_incident_cost:,.0f} in incident costs",
+            feasibility_score=0.6
+        )
+    
+    def _alternative_resourcing_option(
+        self,
+        optimal_result: OptimizationResult,
+        available_budget: float,
+        available_timeline: int,
+        gaps: Dict[str, float]
+    ) -> NegotiationOption:
+        """OPTION 5: Alternative Resourcing."""
+        return NegotiationOption(
             option_id="ALTRESOURCE_001",
             title="Alternative Resourcing Strategy",
             description="Internal resources + timeline extension + bulk purchasing",
@@ -311,21 +618,30 @@ class ConstraintNegotiationEngine:
             requires_approval="manager",
             business_case="Use internal resources, extend timeline, bulk purchase for savings",
             feasibility_score=0.85
-        ))
-        
-        # Select recommended option
-        # Prefer high feasibility + high risk reduction
-        best_option = max(
-            options,
-            key=lambda x: x.feasibility_score * (x.risk_reduction / 100)
         )
+    
+    def _strategy_features(
+        self,
+        strategies: List[Strategy]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (costs, ratios) arrays aligned with `strategies`.
         
-        return NegotiationPackage(
-            original_gap=gaps,
-            options=options,
-            recommended_option=best_option.option_id,
-            recommendation_reason=f"Best balance of feasibility ({best_option.feasibility_score:.0%}) and effectiveness ({best_option.risk_reduction:.0f}%)"
-        )
+        Gathered from the precomputed catalog arrays when every entry is one
+        of the engine's own Strategy objects; otherwise (off-catalog or
+        modified copies) computed from the given objects.
+        """
+        index = self._strategy_index
+        catalog = self.strategies
+        positions = []
+        for s in strategies:
+            i = index.get(s.id)
+            if i is None or catalog[i] is not s:
+                return _cost_effectiveness(strategies)
+            positions.append(i)
+        
+        positions = np.array(positions, dtype=np.intp)
+        return self._costs[positions], self._ratios[positions]
     
     def _select_quick_wins(
         self,
@@ -333,22 +649,12 @@ class ConstraintNegotiationEngine:
         max_budget: float
     ) -> List[Strategy]:
         """Select high-value strategies that fit in budget."""
-        # Sort by cost-effectiveness (risk reduction per dollar)
-        sorted_strats = sorted(
-            strategies,
-            key=lambda s: s.risk_reduction_pct / s.cost_estimate if s.cost_estimate > 0 else 0,
-            reverse=True
-        )
+        if not strategies:
+            return []
         
-        selected = []
-        total_cost = 0
-        
-        for s in sorted_strats:
-            if total_cost + s.cost_estimate <= max_budget:
-                selected.append(s)
-                total_cost += s.cost_estimate
-        
-        return selected
+        costs, ratios = self._strategy_features(strategies)
+        selected = _quick_wins(costs, ratios, float(max_budget))
+        return [strategies[i] for i in selected.tolist()]
     
     def challenge_constraint(
         self,
@@ -360,10 +666,7 @@ class ConstraintNegotiationEngine:
         
         Returns analysis of what's gained by relaxing the constraint.
         """
-        constraint = next(
-            (c for c in self.constraints if c.name == constraint_name),
-            None
-        )
+        constraint = self._constraint_by_name.get(constraint_name)
         
         if not constraint:
             return {"error": f"Constraint '{constraint_name}' not found"}
@@ -379,14 +682,12 @@ class ConstraintNegotiationEngine:
         relaxation_amount = proposed_value - constraint.max_value
         
         # Estimate additional risk reduction possible
-        optimizer = CoreOptimizer(self.strategies, [])
-        
-        original_result = optimizer.get_optimal_portfolio(
+        original_result = self._cached_portfolio(
             budget_limit=constraint.max_value if constraint.category == "budget" else float('inf'),
             risk_tolerance="balanced"
         )
         
-        relaxed_result = optimizer.get_optimal_portfolio(
+        relaxed_result = self._cached_portfolio(
             budget_limit=proposed_value if constraint.category == "budget" else float('inf'),
             risk_tolerance="balanced"
         )
@@ -410,9 +711,13 @@ class ConstraintNegotiationEngine:
 # EXAMPLE USAGE
 # ============================================
 
-if __name__ == "__main__":
+def _demo():
+    """Run the negotiation walkthrough printed by `python -m`."""
     from src.core.optimizer import Strategy, StrategyCategory
     
+    # Script entrypoint: configure logging here rather than at import
+    logging.basicConfig(level=logging.INFO)
+    
     # Sample strategies
     strategies = [
         Strategy(
@@ -491,3 +796,7 @@ if __name__ == "__main__":
     print(f"   Reason: {package.recommendation_reason}")
     
     print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    _demo()
@@ -5,24 +5,28 @@ CRUD operations for strategies.
 """
 
 from typing import List, Optional
+from types import MappingProxyType
+from sqlalchemy import select, func, case
 from sqlalchemy.orm import Session
 import uuid
-from datetime import datetime
 
 from src.db.models import StrategyModel
 from src.core.optimizer import Strategy, StrategyCategory
 
 
+_CATEGORY_MAP = MappingProxyType({
+    "maintenance": StrategyCategory.MAINTENANCE,
+    "training": StrategyCategory.TRAINING,
+    "process": StrategyCategory.PROCESS,
+    "technology": StrategyCategory.TECHNOLOGY,
+    "policy": StrategyCategory.POLICY,
+})
+_DEFAULT_CATEGORY = StrategyCategory.PROCESS
+
+
 def category_str_to_enum(category: str) -> StrategyCategory:
     """Convert string category to enum."""
-    mapping = {
-        "maintenance": StrategyCategory.MAINTENANCE,
-        "training": StrategyCategory.TRAINING,
-        "process": StrategyCategory.PROCESS,
-        "technology": StrategyCategory.TECHNOLOGY,
-        "policy": StrategyCategory.POLICY,
-    }
-    return mapping.get(category.lower(), StrategyCategory.PROCESS)
+    return _CATEGORY_MAP.get(category.lower(), _DEFAULT_CATEGORY)
 
 
 def db_to_strategy(db_strategy: StrategyModel) -> Strategy:
@@ -41,6 +45,41 @@ def db_to_strategy(db_strategy: StrategyModel) -> Strategy:
     )
 
 
+# Read path: plain Core select with db_to_strategy's fallbacks computed in SQL
+# (NULLIF keeps `or` semantics, where a stored 0 also falls back)
+_cols = StrategyModel.__table__.c
+
+STRATEGY_SELECT = select(
+    _cols.id,
+    _cols.name,
+    _cols.category,
+    _cols.risk_reduction_pct,
+    _cols.cost_estimate,
+    func.coalesce(func.nullif(_cols.cost_min, 0), _cols.cost_estimate * 0.8).label("cost_min"),
+    func.coalesce(func.nullif(_cols.cost_max, 0), _cols.cost_estimate * 1.2).label("cost_max"),
+    _cols.time_estimate,
+    func.coalesce(
+        func.nullif(_cols.time_min, 0),
+        case((_cols.time_estimate - 14 > 1, _cols.time_estimate - 14), else_=1)
+    ).label("time_min"),
+    func.coalesce(func.nullif(_cols.time_max, 0), _cols.time_estimate + 30).label("time_max"),
+)
+
+
+def rows_to_strategies(rows) -> List[Strategy]:
+    """Convert STRATEGY_SELECT rows (unpacked in column order) to Strategy dataclasses."""
+    to_enum = category_str_to_enum
+    return [
+        Strategy(
+            strategy_id, name, to_enum(category), risk_reduction_pct,
+            cost_min=cost_min, cost_max=cost_max, cost_estimate=cost_estimate,
+            time_min=time_min, time_max=time_max, time_estimate=time_estimate,
+        )
+        for (strategy_id, name, category, risk_reduction_pct, cost_estimate,
+             cost_min, cost_max, time_estimate, time_min, time_max) in rows
+    ]
+
+
 class StrategyService:
     """Service for managing strategies."""
     
@@ -49,12 +88,11 @@ class StrategyService:
     
     def get_all(self, active_only: bool = True) -> List[Strategy]:
         """Get all strategies."""
-        query = self.db.query(StrategyModel)
+        stmt = STRATEGY_SELECT
         if active_only:
-            query = query.filter(StrategyModel.is_active == True)
+            stmt = stmt.where(_cols.is_active == True)
         
-        db_strategies = query.all()
-        return [db_to_strategy(s) for s in db_strategies]
+        return rows_to_strategies(self.db.execute(stmt))
     
     def get_by_id(self, strategy_id: str) -> Optional[Strategy]:
         """Get strategy by ID."""
@@ -68,12 +106,14 @@ class StrategyService:
     
     def get_by_category(self, category: str) -> List[Strategy]:
         """Get strategies by category."""
-        db_strategies = self.db.query(StrategyModel).filter(
-            StrategyModel.category == category,
-            StrategyModel.is_active == True
-        ).all()
+        rows = self.db.execute(
+            STRATEGY_SELECT.where(
+                _cols.category == category,
+                _cols.is_active == True
+            )
+        )
         
-        return [db_to_strategy(s) for s in db_strategies]
+        return rows_to_strategies(rows)
     
     def create(
         self,
@@ -86,9 +126,36 @@ class StrategyService:
         **kwargs
     ) -> Strategy:
         """Create a new strategy."""
+        db_strategy = self._build_model(
+            name=name,
+            category=category,
+            risk_reduction_pct=risk_reduction_pct,
+            cost_estimate=cost_estimate,
+            time_estimate=time_estimate,
+            description=description,
+            **kwargs
+        )
+        
+        self.db.add(db_strategy)
+        self.db.commit()
+        self.db.refresh(db_strategy)
+        
+        return db_to_strategy(db_strategy)
+    
+    @staticmethod
+    def _build_model(
+        name: str,
+        category: str,
+        risk_reduction_pct: float,
+        cost_estimate: float,
+        time_estimate: int,
+        description: str = "",
+        **kwargs
+    ) -> StrategyModel:
+        """Build an unsaved StrategyModel with a fresh ID and derived ranges."""
         strategy_id = f"{category.upper()[:4]}_{uuid.uuid4().hex[:6].upper()}"
         
-        db_strategy = StrategyModel(
+        return StrategyModel(
             id=strategy_id,
             name=name,
             category=category,
@@ -105,15 +172,15 @@ class StrategyService:
             dependencies=kwargs.get("dependencies", []),
             source=kwargs.get("source", "manual"),
         )
-        
-        self.db.add(db_strategy)
-        self.db.commit()
-        self.db.refresh(db_strategy)
-        
-        return db_to_strategy(db_strategy)
     
     def update(self, strategy_id: str, **updates) -> Optional[Strategy]:
-        """Update a strategy."""
+        """
+        Update a strategy.
+        
+        updated_at is stamped by the column's onupdate. The result is built
+        from the in-memory instance before committing, so no refresh SELECT
+        is needed afterwards.
+        """
         db_strategy = self.db.query(StrategyModel).filter(
             StrategyModel.id == strategy_id
         ).first()
@@ -125,11 +192,10 @@ class StrategyService:
             if hasattr(db_strategy, key):
                 setattr(db_strategy, key, value)
         
-        db_strategy.updated_at = datetime.utcnow()
+        strategy = db_to_strategy(db_strategy)
         self.db.commit()
-        self.db.refresh(db_strategy)
         
-        return db_to_strategy(db_strategy)
+        return strategy
     
     def delete(self, strategy_id: str) -> bool:
         """Soft delete a strategy (mark as inactive)."""
@@ -141,7 +207,6 @@ class StrategyService:
             return False
         
         db_strategy.is_active = False
-        db_strategy.updated_at = datetime.utcnow()
         self.db.commit()
         
         return True
@@ -215,13 +280,20 @@ class StrategyService:
             },
         ]
         
-        for strat_data in default_strategies:
-            # Check if exists
-            existing = self.db.query(StrategyModel).filter(
-                StrategyModel.name == strat_data["name"]
-            ).first()
-            
-            if not existing:
-                self.create(**strat_data)
+        # One query for the defaults that already exist, one batched insert
+        # for the rest
+        existing = {
+            name for (name,) in self.db.query(StrategyModel.name).filter(
+                StrategyModel.name.in_([d["name"] for d in default_strategies])
+            ).all()
+        }
+        
+        to_insert = [
+            self._build_model(**strat_data)
+            for strat_data in default_strategies
+            if strat_data["name"] not in existing
+        ]
         
+        if to_insert:
+            self.db.bulk_save_objects(to_insert)
         self.db.commit()
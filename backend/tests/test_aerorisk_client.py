@@ -0,0 +1,112 @@
+"""Tests for the AeroRisk client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.integrations.aerorisk_client import AeroRiskClient
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    client = AeroRiskClient(base_url="http://aerorisk.test")
+    calls = []
+    
+    async def fake_fetch(http, start_date, end_date, category):
+        calls.append((start_date, end_date, category))
+        await asyncio.sleep(0.01)
+        return {"total": 3}
+    
+    client._fetch_analytics = fake_fetch
+    
+    async def run():
+        return await asyncio.gather(*(client.get_analytics("2024-01-01") for _ in range(5)))
+    
+    results = asyncio.run(run())
+    
+    assert calls == [("2024-01-01", None, None)]
+    assert all(r == {"total": 3} for r in results)
+    assert client._analytics_inflight == {}
+
+
+def test_different_keys_are_fetched_in_parallel():
+    client = AeroRiskClient(base_url="http://aerorisk.test")
+    
+    async def run():
+        b_started = asyncio.Event()
+        
+        async def fake_fetch(http, start_date, end_date, category):
+            if category == "B":
+                b_started.set()
+            else:
+                # Only completes if B's fetch runs while A's is in flight
+                await b_started.wait()
+            return {"category": category}
+        
+        client._fetch_analytics = fake_fetch
+        return await asyncio.wait_for(
+            asyncio.gather(
+                client.get_analytics(category="A"),
+                client.get_analytics(category="B"),
+            ),
+            timeout=1.0,
+        )
+    
+    assert asyncio.run(run()) == [{"category": "A"}, {"category": "B"}]
+
+
+def test_errors_are_not_cached():
+    client = AeroRiskClient(base_url="http://aerorisk.test")
+    responses = [{"error": "timeout"}, {"total": 1}]
+    
+    async def fake_fetch(http, start_date, end_date, category):
+        return responses.pop(0)
+    
+    client._fetch_analytics = fake_fetch
+    
+    async def run():
+        return [await client.get_analytics(), await client.get_analytics(), await client.get_analytics()]
+    
+    assert asyncio.run(run()) == [{"error": "timeout"}, {"total": 1}, {"total": 1}]
+
+
+def batch_client(status_code, exc=None):
+    """Client whose batch POST answers `status_code` (or raises `exc`)."""
+    client = AeroRiskClient(base_url="http://aerorisk.test")
+    singles = []
+    
+    async def fake_post(path, payload):
+        if exc is not None:
+            raise exc
+        return httpx.Response(status_code, content=b"{}")
+    
+    async def fake_single(**flight):
+        singles.append(flight)
+        return None
+    
+    client._post_json = fake_post
+    client.get_risk_score = fake_single
+    return client, singles
+
+
+@pytest.mark.parametrize("status_code, exc", [
+    (503, None),
+    (200, None),  # wrong-length response
+    (None, httpx.ConnectTimeout("timed out")),
+])
+def test_failed_batch_is_not_retried_per_flight(status_code, exc):
+    client, singles = batch_client(status_code, exc)
+    flights = [{"origin": "ORD"}, {"origin": "JFK"}]
+    
+    assert asyncio.run(client.get_risk_scores_batch(flights)) == [None, None]
+    assert singles == []
+    assert client._batch_supported is not False
+
+
+def test_missing_batch_endpoint_falls_back_to_single_predictions():
+    client, singles = batch_client(404)
+    flights = [{"origin": "ORD"}, {"origin": "JFK"}]
+    
+    assert asyncio.run(client.get_risk_scores_batch(flights)) == [None, None]
+    assert singles == flights
+    assert client._batch_supported is False
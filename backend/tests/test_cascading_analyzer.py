@@ -0,0 +1,53 @@
+"""Tests for the cascading impact analyzer."""
+
+import pytest
+
+from src.core.optimizer import OptimizationResult, Strategy, StrategyCategory
+from src.impact.cascading_analyzer import CascadingImpactAnalyzer
+
+
+def make_result():
+    strategies = [
+        Strategy(
+            id="MAINT_001", name="Enhanced Maintenance",
+            category=StrategyCategory.MAINTENANCE,
+            risk_reduction_pct=18.0,
+            cost_estimate=120000, cost_min=80000, cost_max=150000,
+            time_min=30, time_max=60, time_estimate=45
+        ),
+        Strategy(
+            id="TRAIN_001", name="Fatigue Training",
+            category=StrategyCategory.TRAINING,
+            risk_reduction_pct=12.0,
+            cost_estimate=45000, cost_min=30000, cost_max=60000,
+            time_min=14, time_max=30, time_estimate=21
+        ),
+    ]
+    return OptimizationResult(
+        selected_strategies=strategies,
+        total_cost=165000,
+        total_risk_reduction=30.0,
+        total_timeline_days=45,
+    )
+
+
+def test_vectorized_portfolio_matches_analyze_portfolio():
+    analyzer = CascadingImpactAnalyzer()
+    result = make_result()
+    
+    expected = analyzer.analyze_portfolio(result)
+    actual = analyzer.analyze_portfolio_vectorized(result)
+    
+    assert actual.keys() == expected.keys()
+    assert [a.strategy_id for a in actual["strategy_analyses"]] == ["MAINT_001", "TRAIN_001"]
+    for key in ("total_direct_cost", "total_hidden_costs", "total_cost_of_ownership"):
+        assert actual[key] == pytest.approx(expected[key])
+
+
+def test_vectorized_portfolio_can_skip_analyses():
+    analyzer = CascadingImpactAnalyzer()
+    
+    summary = analyzer.analyze_portfolio_vectorized(make_result(), include_analyses=False)
+    
+    assert summary["strategy_analyses"] == []
+    assert summary["total_direct_cost"] == 165000
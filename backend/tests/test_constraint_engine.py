@@ -0,0 +1,79 @@
+"""Tests for the constraint negotiation engine."""
+
+from src.core.optimizer import OptimizationResult, Strategy, StrategyCategory
+from src.negotiation.constraint_engine import ConstraintNegotiationEngine
+
+
+def make_strategy(strategy_id, reduction, cost, days=30):
+    return Strategy(
+        id=strategy_id,
+        name=strategy_id,
+        category=StrategyCategory.PROCESS,
+        risk_reduction_pct=reduction,
+        cost_estimate=cost,
+        time_estimate=days
+    )
+
+
+def make_catalog():
+    return [
+        make_strategy("A", 10.0, 50000),
+        make_strategy("B", 20.0, 60000),
+        make_strategy("C", 5.0, 100000),
+    ]
+
+
+def test_quick_wins_accepts_off_catalog_strategies():
+    catalog = make_catalog()
+    engine = ConstraintNegotiationEngine(catalog, [])
+    outsider = make_strategy("EXTERNAL", 30.0, 10000)
+    
+    selected = engine._select_quick_wins([catalog[0], outsider, catalog[1]], 80000)
+    
+    assert [s.id for s in selected] == ["EXTERNAL", "B"]
+    assert selected[0] is outsider
+
+
+def test_quick_wins_returns_callers_objects_and_keeps_duplicates():
+    catalog = make_catalog()
+    engine = ConstraintNegotiationEngine(catalog, [])
+    # Same id as a catalog entry, different estimates
+    modified = make_strategy("A", 40.0, 1000)
+    
+    selected = engine._select_quick_wins([modified, modified, catalog[2]], 5000)
+    
+    assert selected == [modified, modified]
+    assert all(s is modified for s in selected)
+
+
+def test_quick_wins_uses_catalog_objects_directly():
+    catalog = make_catalog()
+    engine = ConstraintNegotiationEngine(catalog, [])
+    
+    selected = engine._select_quick_wins(catalog, 115000)
+    
+    # Greedy by risk reduction per dollar, skipping what doesn't fit
+    assert [s.id for s in selected] == ["B", "A"]
+    assert selected[0] is catalog[1]
+
+
+def test_phased_option_with_off_catalog_result():
+    catalog = make_catalog()
+    engine = ConstraintNegotiationEngine(catalog, [])
+    outsider = make_strategy("EXTERNAL", 30.0, 10000)
+    result = OptimizationResult(
+        selected_strategies=[outsider, catalog[1], catalog[2]],
+        total_cost=170000,
+        total_risk_reduction=55.0,
+        total_timeline_days=30
+    )
+    
+    package = engine.generate_negotiation_package(
+        optimal_result=result,
+        available_budget=100000,
+        available_timeline=90
+    )
+    
+    phased = next(o for o in package.options if o.option_id == "PHASED_001")
+    assert phased.cost == 70000
+    assert phased.risk_reduction == 50.0
@@ -0,0 +1,116 @@
+"""Tests for the executive decision interface."""
+
+import pytest
+
+from src.core.optimizer import Strategy, StrategyCategory
+from src.interface.executive_interface import ExecutiveDecisionInterface
+
+
+def make_strategies():
+    return [
+        Strategy(
+            id="MAINT_001", name="Enhanced Maintenance",
+            category=StrategyCategory.MAINTENANCE,
+            risk_reduction_pct=18.0,
+            cost_estimate=120000, cost_min=80000, cost_max=150000,
+            time_min=30, time_max=60, time_estimate=45
+        ),
+        Strategy(
+            id="TRAIN_001", name="Fatigue Training",
+            category=StrategyCategory.TRAINING,
+            risk_reduction_pct=12.0,
+            cost_estimate=45000, cost_min=30000, cost_max=60000,
+            time_min=14, time_max=30, time_estimate=21
+        ),
+    ]
+
+
+def test_each_call_returns_an_independent_package():
+    interface = ExecutiveDecisionInterface(make_strategies(), budget=150000, risk_score=70)
+    
+    first = interface.generate_decision_package({"peak_season": True})
+    second = interface.generate_decision_package({"peak_season": True})
+    
+    assert first is not second
+    assert first.scenarios is not second.scenarios
+    assert second.created_at >= first.created_at
+    
+    # One caller mutating its package must not leak into another's
+    first.scenarios.clear()
+    first.briefs()["CEO"].key_points.append("tampered")
+    assert len(second.scenarios) == 5
+    assert "tampered" not in second.briefs()["CEO"].key_points
+
+
+def test_pareto_solves_run_on_the_shared_pool(monkeypatch):
+    import src.core.optimizer as optimizer_module
+    
+    def no_nested_pool(*args, **kwargs):
+        raise AssertionError("get_optimal_portfolio started its own pool")
+    
+    monkeypatch.setattr(optimizer_module, "ThreadPoolExecutor", no_nested_pool)
+    interface = ExecutiveDecisionInterface(make_strategies(), budget=150000, risk_score=70)
+    
+    package = interface.generate_decision_package()
+    
+    assert len(package.scenarios) == 5
+
+
+def test_optimal_portfolio_matches_with_and_without_executor():
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.optimizer import CoreOptimizer
+    
+    optimizer = CoreOptimizer(make_strategies(), [])
+    own_pool = optimizer.get_optimal_portfolio(budget_limit=150000)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        shared = optimizer.get_optimal_portfolio(budget_limit=150000, executor=pool)
+    
+    assert [s.id for s in shared.selected_strategies] == [s.id for s in own_pool.selected_strategies]
+    assert shared.total_cost == own_pool.total_cost
+
+
+def test_engine_caches_are_safe_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.optimizer import Strategy, StrategyCategory
+    from src.horizons.multi_horizon import Horizon, MultiHorizonOptimizer
+    from src.impact.cascading_analyzer import CascadingImpactAnalyzer
+    
+    strategies = [
+        Strategy(
+            id=f"S{i}", name=f"Strategy {i}",
+            category=list(StrategyCategory)[i % len(StrategyCategory)],
+            risk_reduction_pct=5.0 + i,
+            cost_estimate=10000.0 * (i + 1),
+            time_estimate=10 * (i + 1)
+        )
+        for i in range(40)
+    ]
+    analyzer = CascadingImpactAnalyzer()
+    analyzer.ANALYSIS_CACHE_SIZE = 8  # force constant eviction
+    expected = {s.id: CascadingImpactAnalyzer().analyze_strategy(s).total_cost_of_ownership for s in strategies}
+    horizons = MultiHorizonOptimizer(strategies, 500000)
+    
+    def work(i):
+        s = strategies[i % len(strategies)]
+        ranked = horizons._ranked_for_horizon(list(Horizon)[i % len(Horizon)])
+        return s.id, analyzer.analyze_strategy(s).total_cost_of_ownership, ranked
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(work, range(2000)))
+    
+    for strategy_id, tco, _ in results:
+        assert tco == expected[strategy_id]
+    # Every thread sees the single cached ranking for its horizon
+    for i, (_, _, ranked) in enumerate(results):
+        assert ranked is horizons._ranked_for_horizon(list(Horizon)[i % len(Horizon)])
+    assert len(analyzer._analysis_cache) <= 8
+
+
+def test_stakeholder_profiles_are_read_only():
+    interface = ExecutiveDecisionInterface(make_strategies(), budget=150000, risk_score=70)
+    profile = interface.stakeholder_profiles["CEO"]
+    
+    with pytest.raises(TypeError):
+        profile["framing"] = "changed"
+    with pytest.raises(AttributeError):
+        profile["primary_concerns"].append("changed")
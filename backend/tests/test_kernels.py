@@ -0,0 +1,248 @@
+"""
+Parity tests for the optional-JIT numeric kernels.
+
+Each kernel is checked against a plain-Python reference three ways: as
+imported (compiled when Numba is installed), through its `py_func` (the
+uncompiled body), and in a subprocess where Numba is blocked so the no-op
+`njit` from src.core.jit is what decorates it.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.core.jit import NUMBA_AVAILABLE
+from src.horizons.multi_horizon import _greedy_select
+from src.impact.cascading_analyzer import (
+    CascadingImpactAnalyzer, _compute_tco, _SECOND_ORDER, _THIRD_ORDER,
+    _RESOURCE_CODE, _OPERATIONAL_CODE,
+)
+from src.negotiation.constraint_engine import _quick_wins, _score_relaxations
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+requires_numba = pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba not installed")
+
+
+def implementations(kernel):
+    """The kernel as imported, plus its pure-Python body when compiled."""
+    impls = [pytest.param(kernel, id="imported")]
+    if hasattr(kernel, "py_func"):
+        impls.append(pytest.param(kernel.py_func, id="py_func"))
+    return impls
+
+
+# ============================================
+# INPUTS
+# ============================================
+
+def greedy_inputs():
+    rng = np.random.default_rng(7)
+    costs = rng.uniform(1000, 100000, 40).round(-2)
+    return costs, float(costs.sum() / 3)
+
+
+def quick_win_inputs():
+    rng = np.random.default_rng(11)
+    costs = rng.uniform(1000, 100000, 50).round(-3)
+    costs[[3, 17]] = 0.0
+    reductions = rng.integers(1, 25, 50).astype(np.float64)
+    ratios = np.divide(reductions, costs, out=np.zeros_like(reductions), where=costs > 0)
+    # Duplicate a few ratios so the tie-breaking order is exercised
+    ratios[[5, 6, 7]] = ratios[4]
+    return costs, ratios, float(costs.sum() / 4)
+
+
+def relaxation_inputs():
+    rng = np.random.default_rng(13)
+    n = 30
+    return (
+        rng.uniform(10, 100, n),
+        rng.uniform(100, 5000, n),
+        np.where(rng.random(n) < 0.2, 0.0, rng.uniform(0, 60, n)),
+        rng.uniform(0, 0.3, n),
+        True,
+        75.0,
+    )
+
+
+def tco_inputs():
+    rng = np.random.default_rng(17)
+    rule_table = CascadingImpactAnalyzer()._rule_table
+    n_categories = int(rule_table[:, 0].max()) + 1
+    n = 60
+    risk = rng.uniform(0, 40, n)
+    cost = rng.uniform(0, 500000, n)
+    # -1 marks a category without impact rules
+    cat = rng.integers(-1, n_categories, n).astype(np.int64)
+    return risk, cost, cat, rule_table
+
+
+# ============================================
+# REFERENCES
+# ============================================
+
+def greedy_reference(costs, budget):
+    selected, total = [], 0.0
+    for c in costs:
+        fits = total + c <= budget
+        selected.append(fits)
+        if fits:
+            total += c
+    return np.array(selected), total
+
+
+def quick_win_reference(costs, ratios, max_budget):
+    order = sorted(range(len(costs)), key=lambda i: -ratios[i])
+    selected, total = [], 0.0
+    for i in order:
+        if total + costs[i] <= max_budget:
+            selected.append(i)
+            total += costs[i]
+    return np.array(selected, dtype=np.int64)
+
+
+def relaxation_reference(max_vals, costs, max_rel, seasonal, quarter_is_q4, target):
+    feasibility, total_cost = [], []
+    for m, c, r, s in zip(max_vals, costs, max_rel, seasonal):
+        needed = target - (m * (1 + s) if quarter_is_q4 else m)
+        if needed <= 0:
+            feasibility.append(1.0)
+            total_cost.append(0.0)
+        else:
+            feasibility.append(1.0 if needed <= r else max(r, 0.0) / needed)
+            total_cost.append(c * needed)
+    return np.array(feasibility), np.array(total_cost)
+
+
+def tco_reference(risk, cost, cat, rule_table):
+    n = len(risk)
+    second, third = np.zeros(n), np.zeros(n)
+    resource, operational = np.zeros(n), np.zeros(n)
+    for i in range(n):
+        for cat_code, risk_t, cost_t, order, impact, const, coeff in rule_table:
+            if cat[i] != int(cat_code) or risk[i] <= risk_t or cost[i] <= cost_t:
+                continue
+            value = const + coeff * cost[i]
+            if order == _SECOND_ORDER:
+                second[i] += value
+            elif order == _THIRD_ORDER:
+                third[i] += value
+            if impact == _RESOURCE_CODE:
+                resource[i] += value
+            elif impact == _OPERATIONAL_CODE:
+                operational[i] += value
+    return second, third, resource, operational, cost + second + third
+
+
+def assert_outputs_match(actual, expected):
+    if isinstance(expected, tuple):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            np.testing.assert_allclose(a, e, rtol=1e-12)
+    else:
+        np.testing.assert_array_equal(actual, expected)
+
+
+# ============================================
+# IN-PROCESS PARITY
+# ============================================
+
+@pytest.mark.parametrize("kernel", implementations(_greedy_select))
+def test_greedy_select_matches_reference(kernel):
+    costs, budget = greedy_inputs()
+    assert_outputs_match(kernel(costs, budget), greedy_reference(costs, budget))
+
+
+@pytest.mark.parametrize("kernel", implementations(_quick_wins))
+def test_quick_wins_matches_reference(kernel):
+    args = quick_win_inputs()
+    assert_outputs_match(kernel(*args), quick_win_reference(*args))
+
+
+@pytest.mark.parametrize("kernel", implementations(_score_relaxations))
+@pytest.mark.parametrize("quarter_is_q4", [True, False])
+def test_score_relaxations_matches_reference(kernel, quarter_is_q4):
+    args = relaxation_inputs()[:4] + (quarter_is_q4, 75.0)
+    assert_outputs_match(kernel(*args), relaxation_reference(*args))
+
+
+@pytest.mark.parametrize("kernel", implementations(_compute_tco))
+def test_compute_tco_matches_reference(kernel):
+    args = tco_inputs()
+    assert_outputs_match(kernel(*args), tco_reference(*args))
+
+
+@requires_numba
+def test_greedy_select_compiles_with_explicit_signature():
+    # Compiled at import from the declared signature, never lazily
+    assert len(_greedy_select.nopython_signatures) == 1
+    with pytest.raises(TypeError):
+        _greedy_select(np.arange(3), 10.0)
+
+
+# ============================================
+# WITHOUT NUMBA
+# ============================================
+
+_NO_NUMBA_SCRIPT = """
+import json, sys
+sys.modules["numba"] = None
+
+import numpy as np
+from src.core.jit import NUMBA_AVAILABLE
+from src.horizons.multi_horizon import _greedy_select
+from src.impact.cascading_analyzer import _compute_tco
+from src.negotiation.constraint_engine import _quick_wins, _score_relaxations
+
+assert not NUMBA_AVAILABLE
+kernels = {
+    "greedy": _greedy_select,
+    "quick_wins": _quick_wins,
+    "relaxations": _score_relaxations,
+    "tco": _compute_tco,
+}
+
+def encode(value):
+    if isinstance(value, tuple):
+        return [encode(v) for v in value]
+    return np.asarray(value).tolist()
+
+results = {}
+for name, args in json.load(sys.stdin).items():
+    assert not hasattr(kernels[name], "py_func")
+    args = [np.asarray(a) if isinstance(a, list) else a for a in args]
+    results[name] = encode(kernels[name](*args))
+json.dump(results, sys.stdout)
+"""
+
+
+def test_kernels_match_reference_without_numba():
+    cases = {
+        "greedy": (greedy_inputs(), greedy_reference),
+        "quick_wins": (quick_win_inputs(), quick_win_reference),
+        "relaxations": (relaxation_inputs(), relaxation_reference),
+        "tco": (tco_inputs(), tco_reference),
+    }
+    payload = {
+        name: [a.tolist() if isinstance(a, np.ndarray) else a for a in args]
+        for name, (args, _) in cases.items()
+    }
+
+    proc = subprocess.run(
+        [sys.executable, "-c", _NO_NUMBA_SCRIPT],
+        input=json.dumps(payload), capture_output=True, text=True, cwd=BACKEND_DIR,
+    )
+    assert proc.returncode == 0, proc.stderr
+    results = json.loads(proc.stdout)
+
+    for name, (args, reference) in cases.items():
+        expected = reference(*args)
+        actual = results[name]
+        if isinstance(expected, tuple):
+            actual = tuple(actual)
+        assert_outputs_match(actual, expected)
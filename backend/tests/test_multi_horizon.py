@@ -0,0 +1,21 @@
+"""Tests for the multi-horizon optimizer."""
+
+import dataclasses
+
+import pytest
+
+from src.horizons import HORIZON_CONFIGS, Horizon, MultiHorizonOptimizer
+
+
+def test_shared_horizon_configs_are_immutable():
+    optimizer = MultiHorizonOptimizer([], total_budget=100000)
+    config = optimizer.horizons[Horizon.IMMEDIATE]
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.budget_fraction_recommended = 0.9
+    with pytest.raises(AttributeError):
+        config.preferred_categories.append(None)
+    with pytest.raises(TypeError):
+        optimizer.horizons[Horizon.IMMEDIATE] = config
+    
+    assert HORIZON_CONFIGS[Horizon.IMMEDIATE].budget_fraction_recommended == 0.25